@@ -568,10 +568,13 @@ Posición Actual:
         self.root.config(cursor="wait")
         self.status_var.set("Procesando PDF...")
         
+        # Leer la variable Tk en el hilo principal
+        engine = self.pdf_engine_var.get()
+        
         # Procesar en hilo separado
         def process_thread():
             try:
-                result = self.pdf_processor.process_pdf(pdf_path)
+                result = self.pdf_processor.process_pdf(pdf_path, engine)
                 # Llamar callback en hilo principal
                 self.root.after(0, lambda: self._process_pdf_callback(result))
             except Exception as e:
@@ -5,6 +5,7 @@ Aplicación para procesar extractos PDF de FIMA y gestionar operaciones financie
 """
 import sys
 import os
+import multiprocessing
 import tkinter as tk
 from tkinter import messagebox
 import logging
@@ -183,4 +184,6 @@ def main():
         return 1
 
 if __name__ == "__main__":
+    # Necesario para el procesamiento en paralelo dentro del ejecutable de PyInstaller
+    multiprocessing.freeze_support()
     sys.exit(main())
\ No newline at end of file
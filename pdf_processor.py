@@ -4,10 +4,16 @@ MEJORADO ESPECÍFICAMENTE PARA FIMA CON CÁLCULO PEPS
 """
 import re
 import os
+import sys
 from decimal import Decimal, InvalidOperation
-from datetime import datetime
-from typing import List, Dict, Optional, Tuple
+from datetime import date as _date
+from functools import lru_cache, partial
+from itertools import chain
+from operator import itemgetter
+from typing import List, Dict, Optional, Tuple, Iterable, Iterator, Union
 import logging
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 
 # Importar librerías PDF
 try:
@@ -34,11 +40,90 @@ from config import PDF_PATTERNS
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Caracteres a descartar al limpiar montos (todo salvo dígitos, separadores y signo)
+_AMOUNT_STRIP_RE = re.compile(r'[^\d,.-]')
+# Formato argentino: elimina separadores de miles y convierte la coma decimal
+_AR_AMOUNT_TRANS = str.maketrans({'.': None, ',': '.'})
+# Tokens numéricos (cuotas, valor unitario, monto) de una línea de operación
+_NUMBER_TOKEN_RE = re.compile(r'[\d.,]+')
+# Patrones específicos de extractos FIMA, compilados una sola vez
+_FUND_RE = re.compile(r'FONDO - (.+?)(?:\s|$)')
+_POSITION_RE = re.compile(r'Posicion al (\d{2}/\d{2}/\d{4})')
+_LINE_DATE_RE = re.compile(r'^(\d{2}/\d{2}/\d{4})')
+# Línea de operación: fecha al inicio, tipo y al menos dos campos más
+_OPERATION_LINE_RE = re.compile(r'(\d{2}/\d{2}/\d{4}\S*)\s+(\S+)\s+(\S+\s+\S.*)')
+# Nombre de fondo seguido de una cantidad en la misma celda de posiciones
+_FUND_QTY_RE = re.compile(r'^(.*?)\s+([\d.,]+)')
+
+# Tipos de operación que suman (compras) o consumen (ventas) lotes PEPS
+_BUY_TYPES = frozenset(('SUSCRIPCION', 'COMPRA'))
+_SELL_TYPES = frozenset(('RESCATE', 'VENTA'))
+
+def _classify_fund(fund_name: str) -> str:
+    """Tipo de fondo según su nombre"""
+    return 'Money Market' if 'FIMA' in fund_name else 'Otro'
+
+@lru_cache(maxsize=16384)
+def _parse_amount(amount_str: str) -> Optional[Decimal]:
+    """Convertir un monto a Decimal (memoizado: los montos se repiten); None si es inválido"""
+    # Remover caracteres no numéricos excepto puntos y comas
+    cleaned = _AMOUNT_STRIP_RE.sub('', amount_str)
+    
+    # Manejar formato argentino (puntos para miles, comas para decimales)
+    if ',' in cleaned and '.' in cleaned:
+        # Si tiene ambos, asumir formato: 1.234.567,89 y normalizar en una
+        # sola pasada (solo si los puntos están antes de la coma decimal)
+        if cleaned.count(',') == 1 and cleaned.rfind('.') < cleaned.find(','):
+            cleaned = cleaned.translate(_AR_AMOUNT_TRANS)
+    elif ',' in cleaned:
+        # Solo comas - podría ser decimal o miles
+        comma_parts = cleaned.split(',')
+        if len(comma_parts) == 2 and len(comma_parts[1]) <= 2:
+            # Probablemente decimal
+            cleaned = cleaned.replace(',', '.')
+    
+    try:
+        return Decimal(cleaned)
+    except (InvalidOperation, ValueError):
+        return None
+
+def _build_operation(date: str, operation_type: str, fund_name: str, fund_type: str,
+                     quantity: Decimal, unit_value: Decimal, total_amount: Decimal,
+                     pdf_source: Optional[str]) -> Dict:
+    """Armar el dict de una operación (mismo literal => misma forma en todas las filas)"""
+    return {
+        'date': date,
+        'operation_type': operation_type,
+        'fund_name': fund_name,
+        'fund_type': fund_type,
+        'quantity': quantity,
+        'unit_value': unit_value,
+        'total_amount': total_amount,
+        'description': f"{operation_type} - {fund_name}",
+        'pdf_source': pdf_source
+    }
+
+def _error_result(error: str) -> Dict:
+    """Resultado de process_pdf cuando el PDF no se pudo procesar"""
+    return {
+        'success': False,
+        'error': error,
+        'operations': [],
+        'positions': [],
+        'peps_analysis': {}
+    }
+
 class PEPSCalculator:
     """Calculadora de rentabilidad usando método PEPS (Primero En Entrar, Primero En Salir)"""
     
     def __init__(self):
         self.inventory = []  # Lista de compras/suscripciones
+        self._head = 0  # Índice del primer lote con cuotas disponibles
+        
+    def reset(self):
+        """Vaciar el inventario para reutilizar la calculadora con otro fondo"""
+        self.inventory = []
+        self._head = 0
         
     def add_purchase(self, date: str, quantity: Decimal, unit_price: Decimal):
         """Agregar suscripción/compra al inventario PEPS"""
@@ -49,8 +134,12 @@ class PEPSCalculator:
             'remaining': quantity
         })
         
-    def calculate_sale(self, date: str, quantity_sold: Decimal, sale_price: Decimal) -> Dict:
-        """Calcular ganancia/pérdida de un rescate usando PEPS"""
+    def calculate_sale(self, date: str, quantity_sold: Decimal, sale_price: Decimal,
+                       track_lots: bool = True) -> Dict:
+        """Calcular ganancia/pérdida de un rescate usando PEPS
+        
+        Con track_lots=False no se arma el detalle de lotes usados ('used_lots' queda vacío).
+        """
         if not self.inventory:
             return {
                 'gain_loss': Decimal('0'),
@@ -63,11 +152,14 @@ class PEPSCalculator:
         remaining_to_sell = quantity_sold
         used_lots = []
         
-        # Usar lotes en orden PEPS (primero en entrar, primero en salir)
-        for lot in self.inventory:
+        # Usar lotes en orden PEPS (primero en entrar, primero en salir),
+        # empezando por el primer lote no agotado
+        inventory = self.inventory
+        for index in range(self._head, len(inventory)):
             if remaining_to_sell <= 0:
                 break
-                
+            
+            lot = inventory[index]
             if lot['remaining'] > 0:
                 # Cantidad a usar de este lote
                 qty_from_lot = min(lot['remaining'], remaining_to_sell)
@@ -77,12 +169,17 @@ class PEPSCalculator:
                 lot['remaining'] -= qty_from_lot
                 remaining_to_sell -= qty_from_lot
                 
-                used_lots.append({
-                    'date': lot['date'],
-                    'quantity': qty_from_lot,
-                    'unit_price': lot['unit_price'],
-                    'cost': cost_from_lot
-                })
+                if track_lots:
+                    used_lots.append({
+                        'date': lot['date'],
+                        'quantity': qty_from_lot,
+                        'unit_price': lot['unit_price'],
+                        'cost': cost_from_lot
+                    })
+            
+            # Los lotes agotados no se vuelven a recorrer en próximas ventas
+            if lot['remaining'] <= 0:
+                self._head = index + 1
         
         sale_value = quantity_sold * sale_price
         gain_loss = sale_value - total_cost
@@ -127,84 +224,100 @@ class PDFProcessor:
             engines.append('pymupdf')
         return engines
     
-    def extract_text_pypdf2(self, pdf_path: str) -> str:
-        """Extraer texto usando PyPDF2"""
+    def _iter_pages_pypdf2(self, pdf_path: str) -> Iterator[str]:
+        """Texto de cada página usando PyPDF2"""
+        with open(pdf_path, 'rb') as file:
+            pdf_reader = PyPDF2.PdfReader(file)
+            for page in pdf_reader.pages:
+                yield page.extract_text()
+    
+    def _iter_pages_pdfplumber(self, pdf_path: str) -> Iterator[str]:
+        """Texto de cada página usando pdfplumber (omite páginas sin texto)"""
+        with pdfplumber.open(pdf_path) as pdf:
+            for page in pdf.pages:
+                page_text = page.extract_text()
+                if page_text:
+                    yield page_text
+    
+    def _iter_pages_pymupdf(self, pdf_path: str) -> Iterator[str]:
+        """Texto de cada página usando PyMuPDF"""
+        doc = fitz.open(pdf_path)
+        try:
+            for page in doc:
+                yield page.get_text()
+        finally:
+            doc.close()
+    
+    def _iter_pages(self, engine: str, pdf_path: str) -> Iterator[str]:
+        """Texto página por página con el engine indicado"""
+        if engine == 'pdfplumber':
+            return self._iter_pages_pdfplumber(pdf_path)
+        if engine == 'pymupdf':
+            return self._iter_pages_pymupdf(pdf_path)
+        return self._iter_pages_pypdf2(pdf_path)
+    
+    def _engine_order(self, preferred_engine: str) -> List[str]:
+        """Engines a probar: el preferido primero, después el resto en el orden habitual"""
+        return sorted(self.available_engines, key=lambda engine: engine != preferred_engine)
+    
+    def _extract_text_with(self, engine: str, pdf_path: str) -> str:
+        """Texto completo con un engine; cadena vacía si el engine falla"""
         try:
-            text = ""
-            with open(pdf_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
-            return text
+            return "".join(f"{page_text}\n" for page_text in self._iter_pages(engine, pdf_path))
         except Exception as e:
-            logger.error(f"Error extrayendo con PyPDF2: {e}")
+            logger.error(f"Error extrayendo con {engine}: {e}")
             return ""
     
+    def extract_text_pypdf2(self, pdf_path: str) -> str:
+        """Extraer texto usando PyPDF2"""
+        return self._extract_text_with('pypdf2', pdf_path)
+    
     def extract_text_pdfplumber(self, pdf_path: str) -> str:
         """Extraer texto usando pdfplumber"""
-        try:
-            text = ""
-            with pdfplumber.open(pdf_path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-            return text
-        except Exception as e:
-            logger.error(f"Error extrayendo con pdfplumber: {e}")
-            return ""
+        return self._extract_text_with('pdfplumber', pdf_path)
     
     def extract_text_pymupdf(self, pdf_path: str) -> str:
         """Extraer texto usando PyMuPDF"""
-        try:
-            text = ""
-            doc = fitz.open(pdf_path)
-            for page_num in range(doc.page_count):
-                page = doc[page_num]
-                text += page.get_text() + "\n"
-            doc.close()
-            return text
-        except Exception as e:
-            logger.error(f"Error extrayendo con PyMuPDF: {e}")
-            return ""
+        return self._extract_text_with('pymupdf', pdf_path)
     
     def extract_text(self, pdf_path: str, preferred_engine: str = 'pdfplumber') -> str:
         """Extraer texto del PDF usando el mejor engine disponible"""
         if not os.path.exists(pdf_path):
             raise FileNotFoundError(f"Archivo PDF no encontrado: {pdf_path}")
         
-        # Intentar con el engine preferido primero
-        if preferred_engine in self.available_engines:
-            if preferred_engine == 'pdfplumber' and PDFPLUMBER_AVAILABLE:
-                text = self.extract_text_pdfplumber(pdf_path)
-                if text.strip():
-                    return text
-            elif preferred_engine == 'pymupdf' and PYMUPDF_AVAILABLE:
-                text = self.extract_text_pymupdf(pdf_path)
-                if text.strip():
-                    return text
-            elif preferred_engine == 'pypdf2' and PYPDF2_AVAILABLE:
-                text = self.extract_text_pypdf2(pdf_path)
-                if text.strip():
-                    return text
+        # Engine preferido primero; si falla o no devuelve texto, el siguiente
+        for engine in self._engine_order(preferred_engine):
+            text = self._extract_text_with(engine, pdf_path)
+            if text and not text.isspace():
+                logger.info(f"Texto extraído exitosamente con {engine}")
+                return text
         
-        # Fallback: intentar con otros engines
-        for engine in self.available_engines:
-            if engine != preferred_engine:
-                try:
-                    if engine == 'pdfplumber':
-                        text = self.extract_text_pdfplumber(pdf_path)
-                    elif engine == 'pymupdf':
-                        text = self.extract_text_pymupdf(pdf_path)
-                    elif engine == 'pypdf2':
-                        text = self.extract_text_pypdf2(pdf_path)
-                    
-                    if text.strip():
-                        logger.info(f"Texto extraído exitosamente con {engine}")
-                        return text
-                except Exception as e:
-                    logger.warning(f"Engine {engine} falló: {e}")
+        raise Exception("No se pudo extraer texto del PDF con ningún engine")
+    
+    def extract_text_lines(self, pdf_path: str, engine: str = 'pdfplumber') -> Iterator[str]:
+        """Extraer el texto línea a línea con un engine, página por página, sin armar el documento completo"""
+        for page_text in self._iter_pages(engine, pdf_path):
+            yield from page_text.split('\n')
+    
+    def _parse_pdf_streamed(self, pdf_path: str, pdf_source: str, preferred_engine: str) -> Dict:
+        """Parsear a medida que se extraen las páginas, con fallback entre engines"""
+        for engine in self._engine_order(preferred_engine):
+            lines = self.extract_text_lines(pdf_path, engine)
+            try:
+                # Sin texto útil se pasa al siguiente engine, igual que en extract_text
+                leading = []
+                for line in lines:
+                    leading.append(line)
+                    if line and not line.isspace():
+                        break
+                else:
                     continue
+                
+                return self.parse_fima_operations(chain(leading, lines), pdf_source)
+            except Exception as e:
+                # Si el engine falla a mitad del documento se descartan los resultados
+                # parciales y se vuelve a parsear desde el principio con el siguiente
+                logger.warning(f"Engine {engine} falló: {e}")
         
         raise Exception("No se pudo extraer texto del PDF con ningún engine")
     
@@ -213,298 +326,185 @@ class PDFProcessor:
         if not amount_str:
             return Decimal('0')
         
-        # Remover caracteres no numéricos excepto puntos y comas
-        cleaned = re.sub(r'[^\d,.-]', '', str(amount_str))
-        
-        # Manejar formato argentino (puntos para miles, comas para decimales)
-        if ',' in cleaned and '.' in cleaned:
-            # Si tiene ambos, asumir formato: 1.234.567,89
-            parts = cleaned.split(',')
-            if len(parts) == 2:
-                integer_part = parts[0].replace('.', '')
-                decimal_part = parts[1]
-                cleaned = f"{integer_part}.{decimal_part}"
-        elif ',' in cleaned:
-            # Solo comas - podría ser decimal o miles
-            comma_parts = cleaned.split(',')
-            if len(comma_parts) == 2 and len(comma_parts[1]) <= 2:
-                # Probablemente decimal
-                cleaned = cleaned.replace(',', '.')
-        
-        try:
-            return Decimal(cleaned)
-        except (InvalidOperation, ValueError):
+        amount = _parse_amount(str(amount_str))
+        if amount is None:
+            # Fuera del caché: se avisa cada vez que aparece un monto inválido
             logger.warning(f"No se pudo convertir '{amount_str}' a Decimal")
             return Decimal('0')
-    
-def parse_fima_operations(self, text: str, pdf_source: str = None) -> Dict:
-    """Parsear operaciones específicamente para PDFs de FIMA MEJORADO"""
-    operations = []
-    positions = []
-    lines = text.split('\n')
-    
-    current_fund = None
-    parsing_operations = False
-    parsing_positions = False
-    
-    # Patrones específicos mejorados para FIMA
-    fund_pattern = r'FONDO - (.+?)(?:\s|$)'
-    position_pattern = r'Posicion al (\d{2}/\d{2}/\d{4})'
-    date_pattern = r'(\d{2}/\d{2}/\d{4})'
-    
-    logger.info(f"Iniciando parsing de PDF con {len(lines)} líneas")
-    
-    for i, line in enumerate(lines):
-        line = line.strip()
-        if not line:
-            continue
-        
-        logger.debug(f"Línea {i}: {line[:100]}...")  # Log primeros 100 caracteres
-        
-        # Detectar sección de posiciones
-        if 'FIMA-FONDOS COMUNES DE INVERSION' in line or re.search(position_pattern, line):
-            parsing_positions = True
-            parsing_operations = False
-            logger.info("Detectada sección de posiciones")
-            continue
-        
-        # Detectar nuevo fondo en operaciones
-        fund_match = re.search(fund_pattern, line)
-        if fund_match:
-            current_fund = fund_match.group(1).strip()
-            parsing_operations = True
-            parsing_positions = False
-            logger.info(f"Detectado fondo: {current_fund}")
-            continue
-        
-        # Parsear posiciones con patrón más específico
-        if parsing_positions and not parsing_operations:
-            if 'FIMA' in line and line.count('$') >= 2:
-                try:
-                    # Dividir por $ para obtener las partes
-                    parts = [p.strip() for p in line.split('$') if p.strip()]
-                    if len(parts) >= 3:
-                        # Extraer nombre del fondo (antes del primer número)
-                        fund_name_part = parts[0]
-                        quantity_str = parts[1]
-                        total_value_str = parts[2]
+        return amount
+    
+    def parse_fima_operations(self, text: Union[str, Iterable[str]], pdf_source: str = None) -> Dict:
+        """Parsear operaciones específicamente para PDFs de FIMA MEJORADO
+        
+        Acepta el texto completo o un iterable de líneas (ver extract_text_lines).
+        """
+        operations = []
+        positions = []
+        # Referencias locales: evitan resolver atributos en cada línea del bucle
+        operations_append = operations.append
+        positions_append = positions.append
+        clean_amount = self.clean_amount
+        log_info = logger.info
+        log_warning = logger.warning
+        
+        current_fund = None
+        current_fund_type = None
+        parsing_operations = False
+        parsing_positions = False
+        
+        if isinstance(text, str):
+            lines = text.split('\n')
+            log_info(f"Iniciando parsing de PDF con {len(lines)} líneas")
+        else:
+            log_info("Iniciando parsing de PDF por páginas")
+            lines = text
+        # Evitar formatear mensajes por línea/operación si DEBUG no está activo
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        
+        for i, line in enumerate(lines):
+            line = line.strip()
+            if not line:
+                continue
+            
+            if debug_enabled:
+                logger.debug(f"Línea {i}: {line[:100]}...")  # Log primeros 100 caracteres
+            
+            # Detectar sección de posiciones
+            if 'FIMA-FONDOS COMUNES DE INVERSION' in line or _POSITION_RE.search(line):
+                parsing_positions = True
+                parsing_operations = False
+                log_info("Detectada sección de posiciones")
+                continue
+            
+            # Detectar nuevo fondo en operaciones
+            fund_match = _FUND_RE.search(line)
+            if fund_match:
+                # Internado: se usa como clave de agrupación en el análisis PEPS
+                current_fund = sys.intern(fund_match.group(1).strip())
+                # El tipo no cambia dentro del bloque del fondo
+                current_fund_type = _classify_fund(current_fund)
+                parsing_operations = True
+                parsing_positions = False
+                log_info(f"Detectado fondo: {current_fund}")
+                continue
+            
+            # Parsear posiciones con patrón más específico
+            if parsing_positions and not parsing_operations:
+                if 'FIMA' in line and line.count('$') >= 2:
+                    try:
+                        # Dividir por $ para obtener las partes (un solo strip por parte)
+                        parts = [p for p in map(str.strip, line.split('$')) if p]
+                        if len(parts) >= 3:
+                            # Extraer nombre del fondo (antes del primer número)
+                            fund_name_part = parts[0]
+                            quantity_str = parts[1]
+                            total_value_str = parts[2]
 
-                        # Heurística para separar nombre de fondo y cantidad si vienen juntos
-                        match = re.match(r'^(.*?)\s+([\d.,]+)', fund_name_part)
-                        if match:
-                            fund_name = match.group(1).strip()
-                            # La cantidad ya la tenemos de la segunda parte del split
-                        else:
-                            fund_name = fund_name_part
-                        
-                        position = {
-                            'fund_name': fund_name,
-                            'fund_type': 'Money Market' if 'FIMA' in fund_name else 'Otro',
-                            'quantity': self.clean_amount(quantity_str),
-                            'unit_value': self.clean_amount(total_value_str) / self.clean_amount(quantity_str) if self.clean_amount(quantity_str) != 0 else Decimal(0),
-                            'total_value': self.clean_amount(total_value_str)
-                        }
-                        positions.append(position)
-                        logger.info(f"Posición parseada: {fund_name} - {quantity_str} cuotas")
+                            # Heurística para separar nombre de fondo y cantidad si vienen juntos
+                            match = _FUND_QTY_RE.match(fund_name_part)
+                            if match:
+                                fund_name = sys.intern(match.group(1).strip())
+                                # La cantidad ya la tenemos de la segunda parte del split
+                            else:
+                                fund_name = sys.intern(fund_name_part)
+                            
+                            quantity = clean_amount(quantity_str)
+                            total_value = clean_amount(total_value_str)
+                            position = {
+                                'fund_name': fund_name,
+                                'fund_type': _classify_fund(fund_name),
+                                'quantity': quantity,
+                                'unit_value': total_value / quantity if quantity != 0 else Decimal(0),
+                                'total_value': total_value
+                            }
+                            positions_append(position)
+                            log_info(f"Posición parseada: {fund_name} - {quantity_str} cuotas")
+                    
+                    except Exception as e:
+                        log_warning(f"Error parseando posición en línea {i}: {e} - Línea: {line}")
+                        continue
+            
+            # Parsear operaciones con lógica mejorada
+            if parsing_operations and current_fund:
+                # Solo las líneas que empiezan con dos dígitos pueden empezar con fecha
+                if not line[:2].isdigit():
+                    continue
                 
-                except Exception as e:
-                    logger.warning(f"Error parseando posición en línea {i}: {e} - Línea: {line}")
+                # Fecha, tipo y resto de la línea (al menos dos campos) en una sola pasada
+                operation_match = _OPERATION_LINE_RE.match(line)
+                if not operation_match:
+                    if _LINE_DATE_RE.match(line):
+                        log_warning(f"Línea con formato inesperado en línea {i}: {len(line.split())} partes - {line}")
                     continue
-        
-        # Parsear operaciones con lógica mejorada
-        if parsing_operations and current_fund:
-            # Verificar si la línea contiene una fecha al inicio
-            date_match = re.match(r'^(\d{2}/\d{2}/\d{4})', line)
-            if date_match:
+                
                 try:
-                    parts = line.split()
-                    
-                    if len(parts) >= 4:
-                        date = self._parse_date(parts[0])
-                        operation_type = parts[1].upper()
-                        
-                        # Limpiar y unir las partes restantes para buscar los números
-                        remaining_line = ' '.join(parts[2:])
+                    date_token, type_token, remaining_line = operation_match.groups()
+                    date = self._parse_date(date_token)
+                    # Pocos tipos distintos por PDF: compartir una sola instancia
+                    operation_type = sys.intern(type_token.upper())
+                    
+                    # Extraer todos los números del resto de la línea
+                    numbers = _NUMBER_TOKEN_RE.findall(remaining_line)
+                    
+                    if len(numbers) >= 3:
+                        quantity = clean_amount(numbers[0])
+                        unit_value = clean_amount(numbers[1])
+                        total_amount = clean_amount(numbers[2])
                         
-                        # Extraer todos los números de la línea
-                        numbers = re.findall(r'[\d.,]+', remaining_line)
-                        
-                        if len(numbers) >= 3:
-                            quantity = self.clean_amount(numbers[0])
-                            unit_value = self.clean_amount(numbers[1])
-                            total_amount = self.clean_amount(numbers[2])
-                            
-                            if quantity > 0 and unit_value > 0 and total_amount > 0:
-                                operation = {
-                                    'date': date,
-                                    'operation_type': operation_type,
-                                    'fund_name': current_fund,
-                                    'fund_type': 'Money Market' if 'FIMA' in current_fund else 'Otro',
-                                    'quantity': quantity,
-                                    'unit_value': unit_value,
-                                    'total_amount': total_amount,
-                                    'description': f"{operation_type} - {current_fund}",
-                                    'pdf_source': pdf_source
-                                }
-                                operations.append(operation)
-                                logger.info(f"Operación parseada: {date} {operation_type} {quantity} cuotas a ${unit_value} = ${total_amount}")
-                            else:
-                                logger.warning(f"Valores inválidos en línea {i}: cantidad={quantity}, valor={unit_value}, total={total_amount}")
+                        if quantity > 0 and unit_value > 0 and total_amount > 0:
+                            operation = _build_operation(
+                                date, operation_type, current_fund,
+                                current_fund_type,
+                                quantity, unit_value, total_amount, pdf_source
+                            )
+                            operations_append(operation)
+                            if debug_enabled:
+                                logger.debug(f"Operación parseada: {date} {operation_type} {quantity} cuotas a ${unit_value} = ${total_amount}")
                         else:
-                            logger.warning(f"Insuficientes valores numéricos en línea {i}: {numbers}")
+                            log_warning(f"Valores inválidos en línea {i}: cantidad={quantity}, valor={unit_value}, total={total_amount}")
                     else:
-                        logger.warning(f"Línea con formato inesperado en línea {i}: {len(parts)} partes - {line}")
+                        log_warning(f"Insuficientes valores numéricos en línea {i}: {numbers}")
                 
                 except Exception as e:
-                    logger.warning(f"Error parseando operación en línea {i}: {e} - Línea: {line}")
+                    log_warning(f"Error parseando operación en línea {i}: {e} - Línea: {line}")
                     continue
-    
-    logger.info(f"Parsing completado: {len(operations)} operaciones, {len(positions)} posiciones")
-    
-    return {
-        'operations': operations,
-        'positions': positions
-    }
-    
-    def calculate_peps_analysis(self, operations: List[Dict]) -> Dict:
-        """Calcular análisis PEPS para cada fondo"""
-        funds_analysis = {}
         
-        # Agrupar operaciones por fondo
-        funds_operations = {}
-        for op in operations:
-            fund_name = op['fund_name']
-            if fund_name not in funds_operations:
-                funds_operations[fund_name] = []
-            funds_operations[fund_name].append(op)
+        log_info(f"Parsing completado: {len(operations)} operaciones, {len(positions)} posiciones")
         
-        # Calcular PEPS para cada fondo
-        for fund_name, fund_ops in funds_operations.items():
-            # Ordenar operaciones por fecha
-            fund_ops.sort(key=lambda x: x['date'])
-            
-            peps_calc = PEPSCalculator()
-            fund_analysis = {
-                'fund_name': fund_name,
-                'total_purchases': Decimal('0'),
-                'total_sales': Decimal('0'),
-                'total_gain_loss': Decimal('0'),
-                'operations_detail': [],
-                'current_position': {}
-            }
-            
-            for op in fund_ops:
-                if op['operation_type'] in ['SUSCRIPCION', 'COMPRA']:
-                    # Agregar compra al PEPS
-                    peps_calc.add_purchase(op['date'], op['quantity'], op['unit_value'])
-                    fund_analysis['total_purchases'] += op['total_amount']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'COMPRA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount']
-                    })
-                    
-                elif op['operation_type'] in ['RESCATE', 'VENTA']:
-                    # Calcular venta con PEPS
-                    peps_result = peps_calc.calculate_sale(
-                        op['date'], op['quantity'], op['unit_value']
-                    )
-                    
-                    fund_analysis['total_sales'] += op['total_amount']
-                    fund_analysis['total_gain_loss'] += peps_result['gain_loss']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'VENTA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount'],
-                        'cost_basis': peps_result['cost_basis'],
-                        'gain_loss': peps_result['gain_loss'],
-                        'used_lots': peps_result.get('used_lots', [])
-                    })
-            
-            # Posición actual
-            fund_analysis['current_position'] = peps_calc.get_current_position()
-            funds_analysis[fund_name] = fund_analysis
+        return {
+            'operations': operations,
+            'positions': positions
+        }
         
-        return funds_analysis
-    
-    def _parse_date(self, date_str: str) -> str:
-        """Convertir fecha a formato ISO"""
-        try:
-            # Intentar formato DD/MM/YYYY
-            if '/' in date_str:
-                parts = date_str.split('/')
-                if len(parts) == 3:
-                    day, month, year = parts
-                    # Validar año
-                    if len(year) == 2:
-                        year = '20' + year if int(year) < 50 else '19' + year
-                    
-                    date_obj = datetime(int(year), int(month), int(day))
-                    return date_obj.strftime('%Y-%m-%d')
-        except (ValueError, IndexError):
-            pass
+    def calculate_peps_analysis(self, operations: List[Dict], detail: bool = True) -> Dict:
+        """Calcular análisis PEPS para cada fondo
         
-        return date_str
-    
-    def process_pdf(self, pdf_path: str) -> Dict:
-        """Procesar PDF completo y retornar operaciones, posiciones y análisis PEPS"""
-        try:
-            text = self.extract_text(pdf_path)
-            if not text.strip():
-                raise Exception("No se pudo extraer texto del PDF")
-            
-            # Parsear con método específico para FIMA
-            parsed_data = self.parse_fima_operations(text, os.path.basename(pdf_path))
-            operations = parsed_data['operations']
-            positions = parsed_data['positions']
-            
-            # Calcular análisis PEPS
-            peps_analysis = self.calculate_peps_analysis(operations)
-            
-            return {
-                'success': True,
-                'operations': operations,
-                'positions': positions,
-                'peps_analysis': peps_analysis,
-                'total_operations': len(operations),
-                'total_positions': len(positions),
-                'pdf_source': os.path.basename(pdf_path)
-            }
-            
-        except Exception as e:
-            logger.error(f"Error procesando PDF {pdf_path}: {e}")
-            return {
-                'success': False,
-                'error': str(e),
-                'operations': [],
-                'positions': [],
-                'peps_analysis': {}
-            } in line and line.count('
-    
-    def calculate_peps_analysis(self, operations: List[Dict]) -> Dict:
-        """Calcular análisis PEPS para cada fondo"""
+        Con detail=False solo se calculan totales y posición actual: 'operations_detail'
+        queda vacío y no se registran los lotes usados en cada venta.
+        """
+        if not operations:
+            return {}
+
         funds_analysis = {}
         
-        # Agrupar operaciones por fondo
-        funds_operations = {}
+        # Ordenar una sola vez por fecha (orden estable) y agrupar por fondo:
+        # cada grupo conserva el orden cronológico sin ordenarlo de nuevo.
+        # Los resúmenes FIMA ya vienen en orden cronológico; en ese caso
+        # basta con una pasada lineal de verificación
+        dates = list(map(itemgetter('date'), operations))
+        if any(previous > current for previous, current in zip(dates, dates[1:])):
+            operations = sorted(operations, key=itemgetter('date'))
+        
+        funds_operations = defaultdict(list)
         for op in operations:
-            fund_name = op['fund_name']
-            if fund_name not in funds_operations:
-                funds_operations[fund_name] = []
-            funds_operations[fund_name].append(op)
+            funds_operations[op['fund_name']].append(op)
         
-        # Calcular PEPS para cada fondo
+        # Calcular PEPS para cada fondo (una sola calculadora reutilizada)
+        peps_calc = PEPSCalculator()
+        add_purchase = peps_calc.add_purchase
+        calculate_sale = peps_calc.calculate_sale
         for fund_name, fund_ops in funds_operations.items():
-            # Ordenar operaciones por fecha
-            fund_ops.sort(key=lambda x: x['date'])
-            
-            peps_calc = PEPSCalculator()
+            peps_calc.reset()
             fund_analysis = {
                 'fund_name': fund_name,
                 'total_purchases': Decimal('0'),
@@ -513,40 +513,56 @@ def parse_fima_operations(self, text: str, pdf_source: str = None) -> Dict:
                 'operations_detail': [],
                 'current_position': {}
             }
+            # Acumular en variables locales y volcar al dict una sola vez por fondo
+            total_purchases = Decimal('0')
+            total_sales = Decimal('0')
+            total_gain_loss = Decimal('0')
+            details_append = fund_analysis['operations_detail'].append
             
             for op in fund_ops:
-                if op['operation_type'] in ['SUSCRIPCION', 'COMPRA']:
+                # Leer cada campo una sola vez por operación
+                operation_type = op['operation_type']
+                op_date = op['date']
+                quantity = op['quantity']
+                unit_value = op['unit_value']
+                total_amount = op['total_amount']
+                
+                if operation_type in _BUY_TYPES:
                     # Agregar compra al PEPS
-                    peps_calc.add_purchase(op['date'], op['quantity'], op['unit_value'])
-                    fund_analysis['total_purchases'] += op['total_amount']
+                    add_purchase(op_date, quantity, unit_value)
+                    total_purchases += total_amount
                     
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'COMPRA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount']
-                    })
+                    if detail:
+                        details_append({
+                            'date': op_date,
+                            'type': 'COMPRA',
+                            'quantity': quantity,
+                            'unit_price': unit_value,
+                            'total': total_amount
+                        })
                     
-                elif op['operation_type'] in ['RESCATE', 'VENTA']:
+                elif operation_type in _SELL_TYPES:
                     # Calcular venta con PEPS
-                    peps_result = peps_calc.calculate_sale(
-                        op['date'], op['quantity'], op['unit_value']
-                    )
+                    peps_result = calculate_sale(op_date, quantity, unit_value, detail)
                     
-                    fund_analysis['total_sales'] += op['total_amount']
-                    fund_analysis['total_gain_loss'] += peps_result['gain_loss']
+                    total_sales += total_amount
+                    total_gain_loss += peps_result['gain_loss']
                     
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'VENTA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount'],
-                        'cost_basis': peps_result['cost_basis'],
-                        'gain_loss': peps_result['gain_loss'],
-                        'used_lots': peps_result.get('used_lots', [])
-                    })
+                    if detail:
+                        details_append({
+                            'date': op_date,
+                            'type': 'VENTA',
+                            'quantity': quantity,
+                            'unit_price': unit_value,
+                            'total': total_amount,
+                            'cost_basis': peps_result['cost_basis'],
+                            'gain_loss': peps_result['gain_loss'],
+                            'used_lots': peps_result.get('used_lots', [])
+                        })
+            
+            fund_analysis['total_purchases'] = total_purchases
+            fund_analysis['total_sales'] = total_sales
+            fund_analysis['total_gain_loss'] = total_gain_loss
             
             # Posición actual
             fund_analysis['current_position'] = peps_calc.get_current_position()
@@ -554,9 +570,15 @@ def parse_fima_operations(self, text: str, pdf_source: str = None) -> Dict:
         
         return funds_analysis
     
-    def _parse_date(self, date_str: str) -> str:
-        """Convertir fecha a formato ISO"""
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _parse_date(date_str: str) -> str:
+        """Convertir fecha a formato ISO (memoizado: las fechas se repiten mucho)"""
         try:
+            # Camino rápido para el formato habitual DD/MM/YYYY (sin split)
+            if len(date_str) == 10 and date_str[2] == '/' and date_str[5] == '/':
+                return _date(int(date_str[6:]), int(date_str[3:5]), int(date_str[:2])).isoformat()
+            
             # Intentar formato DD/MM/YYYY
             if '/' in date_str:
                 parts = date_str.split('/')
@@ -566,146 +588,40 @@ def parse_fima_operations(self, text: str, pdf_source: str = None) -> Dict:
                     if len(year) == 2:
                         year = '20' + year if int(year) < 50 else '19' + year
                     
-                    date_obj = datetime(int(year), int(month), int(day))
-                    return date_obj.strftime('%Y-%m-%d')
+                    # date() valida el calendario; isoformat() evita interpretar
+                    # un formato como strftime
+                    return _date(int(year), int(month), int(day)).isoformat()
         except (ValueError, IndexError):
             pass
         
         return date_str
     
-    def process_pdf(self, pdf_path: str) -> Dict:
-        """Procesar PDF completo y retornar operaciones, posiciones y análisis PEPS"""
-        try:
-            text = self.extract_text(pdf_path)
-            if not text.strip():
-                raise Exception("No se pudo extraer texto del PDF")
-            
-            # Parsear con método específico para FIMA
-            parsed_data = self.parse_fima_operations(text, os.path.basename(pdf_path))
-            operations = parsed_data['operations']
-            positions = parsed_data['positions']
-            
-            # Calcular análisis PEPS
-            peps_analysis = self.calculate_peps_analysis(operations)
-            
-            return {
-                'success': True,
-                'operations': operations,
-                'positions': positions,
-                'peps_analysis': peps_analysis,
-                'total_operations': len(operations),
-                'total_positions': len(positions),
-                'pdf_source': os.path.basename(pdf_path)
-            }
-            
-        except Exception as e:
-            logger.error(f"Error procesando PDF {pdf_path}: {e}")
-            return {
-                'success': False,
-                'error': str(e),
-                'operations': [],
-                'positions': [],
-                'peps_analysis': {}
-            }) >= 2:
-                    try:
-                        # Dividir por $ para obtener las partes
-                        parts = line.split('
-    
-    def calculate_peps_analysis(self, operations: List[Dict]) -> Dict:
-        """Calcular análisis PEPS para cada fondo"""
-        funds_analysis = {}
-        
-        # Agrupar operaciones por fondo
-        funds_operations = {}
-        for op in operations:
-            fund_name = op['fund_name']
-            if fund_name not in funds_operations:
-                funds_operations[fund_name] = []
-            funds_operations[fund_name].append(op)
-        
-        # Calcular PEPS para cada fondo
-        for fund_name, fund_ops in funds_operations.items():
-            # Ordenar operaciones por fecha
-            fund_ops.sort(key=lambda x: x['date'])
-            
-            peps_calc = PEPSCalculator()
-            fund_analysis = {
-                'fund_name': fund_name,
-                'total_purchases': Decimal('0'),
-                'total_sales': Decimal('0'),
-                'total_gain_loss': Decimal('0'),
-                'operations_detail': [],
-                'current_position': {}
-            }
-            
-            for op in fund_ops:
-                if op['operation_type'] in ['SUSCRIPCION', 'COMPRA']:
-                    # Agregar compra al PEPS
-                    peps_calc.add_purchase(op['date'], op['quantity'], op['unit_value'])
-                    fund_analysis['total_purchases'] += op['total_amount']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'COMPRA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount']
-                    })
-                    
-                elif op['operation_type'] in ['RESCATE', 'VENTA']:
-                    # Calcular venta con PEPS
-                    peps_result = peps_calc.calculate_sale(
-                        op['date'], op['quantity'], op['unit_value']
-                    )
-                    
-                    fund_analysis['total_sales'] += op['total_amount']
-                    fund_analysis['total_gain_loss'] += peps_result['gain_loss']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'VENTA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount'],
-                        'cost_basis': peps_result['cost_basis'],
-                        'gain_loss': peps_result['gain_loss'],
-                        'used_lots': peps_result.get('used_lots', [])
-                    })
-            
-            # Posición actual
-            fund_analysis['current_position'] = peps_calc.get_current_position()
-            funds_analysis[fund_name] = fund_analysis
-        
-        return funds_analysis
-    
-    def _parse_date(self, date_str: str) -> str:
-        """Convertir fecha a formato ISO"""
+    def _has_pdf_header(self, pdf_path: str) -> bool:
+        """Verificar la firma %PDF sin abrir el documento con ningún engine"""
         try:
-            # Intentar formato DD/MM/YYYY
-            if '/' in date_str:
-                parts = date_str.split('/')
-                if len(parts) == 3:
-                    day, month, year = parts
-                    # Validar año
-                    if len(year) == 2:
-                        year = '20' + year if int(year) < 50 else '19' + year
-                    
-                    date_obj = datetime(int(year), int(month), int(day))
-                    return date_obj.strftime('%Y-%m-%d')
-        except (ValueError, IndexError):
-            pass
-        
-        return date_str
+            with open(pdf_path, 'rb') as file:
+                # La especificación admite basura antes de la firma en el primer KB
+                return b'%PDF' in file.read(1024)
+        except OSError:
+            # Dejar que los engines informen el error real (permisos, etc.)
+            return True
     
-    def process_pdf(self, pdf_path: str) -> Dict:
+    def process_pdf(self, pdf_path: str, preferred_engine: str = 'pdfplumber') -> Dict:
         """Procesar PDF completo y retornar operaciones, posiciones y análisis PEPS"""
         try:
-            text = self.extract_text(pdf_path)
-            if not text.strip():
-                raise Exception("No se pudo extraer texto del PDF")
+            if not os.path.exists(pdf_path):
+                raise FileNotFoundError(f"Archivo PDF no encontrado: {pdf_path}")
             
-            # Parsear con método específico para FIMA
-            parsed_data = self.parse_fima_operations(text, os.path.basename(pdf_path))
+            # Descartar archivos vacíos o que no son PDF antes de intentar con los engines
+            if not self._has_pdf_header(pdf_path):
+                logger.error(f"Archivo vacío o no es un PDF: {pdf_path}")
+                return _error_result('El archivo está vacío o no es un PDF válido')
+            
+            pdf_source = os.path.basename(pdf_path)
+            
+            # Parsear con método específico para FIMA a medida que se extraen
+            # las páginas; falla si ningún engine obtiene texto
+            parsed_data = self._parse_pdf_streamed(pdf_path, pdf_source, preferred_engine)
             operations = parsed_data['operations']
             positions = parsed_data['positions']
             
@@ -719,3978 +635,25 @@ def parse_fima_operations(self, text: str, pdf_source: str = None) -> Dict:
                 'peps_analysis': peps_analysis,
                 'total_operations': len(operations),
                 'total_positions': len(positions),
-                'pdf_source': os.path.basename(pdf_path)
+                'pdf_source': pdf_source
             }
             
         except Exception as e:
             logger.error(f"Error procesando PDF {pdf_path}: {e}")
-            return {
-                'success': False,
-                'error': str(e),
-                'operations': [],
-                'positions': [],
-                'peps_analysis': {}
-            })
-                        if len(parts) >= 3:
-                            # Extraer nombre del fondo (antes del primer número)
-                            fund_name_part = parts[0].strip()
-                            # Remover números al final del nombre del fondo
-                            fund_name_match = re.match(r'^(.+?)\s+([\d.,]+)
+            return _error_result(str(e))
     
-    def calculate_peps_analysis(self, operations: List[Dict]) -> Dict:
-        """Calcular análisis PEPS para cada fondo"""
-        funds_analysis = {}
-        
-        # Agrupar operaciones por fondo
-        funds_operations = {}
-        for op in operations:
-            fund_name = op['fund_name']
-            if fund_name not in funds_operations:
-                funds_operations[fund_name] = []
-            funds_operations[fund_name].append(op)
+    def process_pdfs(self, pdf_paths: List[str], max_workers: Optional[int] = None,
+                     preferred_engine: str = 'pdfplumber') -> List[Dict]:
+        """Procesar varios PDFs en paralelo (un proceso por archivo), respetando el orden"""
+        # Un solo archivo no justifica levantar el pool de procesos
+        if len(pdf_paths) < 2:
+            return [self.process_pdf(pdf_path, preferred_engine) for pdf_path in pdf_paths]
         
-        # Calcular PEPS para cada fondo
-        for fund_name, fund_ops in funds_operations.items():
-            # Ordenar operaciones por fecha
-            fund_ops.sort(key=lambda x: x['date'])
-            
-            peps_calc = PEPSCalculator()
-            fund_analysis = {
-                'fund_name': fund_name,
-                'total_purchases': Decimal('0'),
-                'total_sales': Decimal('0'),
-                'total_gain_loss': Decimal('0'),
-                'operations_detail': [],
-                'current_position': {}
-            }
-            
-            for op in fund_ops:
-                if op['operation_type'] in ['SUSCRIPCION', 'COMPRA']:
-                    # Agregar compra al PEPS
-                    peps_calc.add_purchase(op['date'], op['quantity'], op['unit_value'])
-                    fund_analysis['total_purchases'] += op['total_amount']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'COMPRA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount']
-                    })
-                    
-                elif op['operation_type'] in ['RESCATE', 'VENTA']:
-                    # Calcular venta con PEPS
-                    peps_result = peps_calc.calculate_sale(
-                        op['date'], op['quantity'], op['unit_value']
-                    )
-                    
-                    fund_analysis['total_sales'] += op['total_amount']
-                    fund_analysis['total_gain_loss'] += peps_result['gain_loss']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'VENTA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount'],
-                        'cost_basis': peps_result['cost_basis'],
-                        'gain_loss': peps_result['gain_loss'],
-                        'used_lots': peps_result.get('used_lots', [])
-                    })
-            
-            # Posición actual
-            fund_analysis['current_position'] = peps_calc.get_current_position()
-            funds_analysis[fund_name] = fund_analysis
-        
-        return funds_analysis
-    
-    def _parse_date(self, date_str: str) -> str:
-        """Convertir fecha a formato ISO"""
-        try:
-            # Intentar formato DD/MM/YYYY
-            if '/' in date_str:
-                parts = date_str.split('/')
-                if len(parts) == 3:
-                    day, month, year = parts
-                    # Validar año
-                    if len(year) == 2:
-                        year = '20' + year if int(year) < 50 else '19' + year
-                    
-                    date_obj = datetime(int(year), int(month), int(day))
-                    return date_obj.strftime('%Y-%m-%d')
-        except (ValueError, IndexError):
-            pass
-        
-        return date_str
-    
-    def process_pdf(self, pdf_path: str) -> Dict:
-        """Procesar PDF completo y retornar operaciones, posiciones y análisis PEPS"""
-        try:
-            text = self.extract_text(pdf_path)
-            if not text.strip():
-                raise Exception("No se pudo extraer texto del PDF")
-            
-            # Parsear con método específico para FIMA
-            parsed_data = self.parse_fima_operations(text, os.path.basename(pdf_path))
-            operations = parsed_data['operations']
-            positions = parsed_data['positions']
-            
-            # Calcular análisis PEPS
-            peps_analysis = self.calculate_peps_analysis(operations)
-            
-            return {
-                'success': True,
-                'operations': operations,
-                'positions': positions,
-                'peps_analysis': peps_analysis,
-                'total_operations': len(operations),
-                'total_positions': len(positions),
-                'pdf_source': os.path.basename(pdf_path)
-            }
-            
-        except Exception as e:
-            logger.error(f"Error procesando PDF {pdf_path}: {e}")
-            return {
-                'success': False,
-                'error': str(e),
-                'operations': [],
-                'positions': [],
-                'peps_analysis': {}
-            }, fund_name_part)
-                            if fund_name_match:
-                                fund_name = fund_name_match.group(1).strip()
-                                quantity_str = fund_name_match.group(2).strip()
-                            else:
-                                # Fallback: usar todo como nombre del fondo
-                                fund_name = fund_name_part
-                                quantity_str = '0'
-                            
-                            # Extraer valor unitario y valor total
-                            unit_value_str = parts[1].strip()
-                            total_value_str = parts[2].strip()
-                            
-                            position = {
-                                'fund_name': fund_name,
-                                'fund_type': 'Money Market' if 'FIMA' in fund_name else 'Otro',
-                                'quantity': self.clean_amount(quantity_str),
-                                'unit_value': self.clean_amount(unit_value_str),
-                                'total_value': self.clean_amount(total_value_str)
-                            }
-                            positions.append(position)
-                            logger.info(f"Posición parseada: {fund_name} - {quantity_str} cuotas")
-                    
-                    except Exception as e:
-                        logger.warning(f"Error parseando posición en línea {i}: {e} - Línea: {line}")
-                        continue
-            
-            # Parsear operaciones con lógica mejorada
-            if parsing_operations and current_fund:
-                # Verificar si la línea contiene una fecha al inicio
-                date_match = re.match(r'^(\d{2}/\d{2}/\d{4})', line)
-                if date_match:
-                    try:
-                        # Dividir la línea por espacios/tabulaciones, manteniendo los signos $
-                        parts = line.split()
-                        
-                        if len(parts) >= 6:  # Necesitamos al menos fecha, tipo, cantidad, $, valor, $, monto, fecha
-                            date = self._parse_date(parts[0])
-                            operation_type = parts[1].upper()
-                            
-                            # Encontrar las partes numéricas (buscar patrones con $)
-                            numeric_parts = []
-                            for j, part in enumerate(parts[2:], 2):  # Empezar desde el índice 2
-                                if '
-    
-    def calculate_peps_analysis(self, operations: List[Dict]) -> Dict:
-        """Calcular análisis PEPS para cada fondo"""
-        funds_analysis = {}
-        
-        # Agrupar operaciones por fondo
-        funds_operations = {}
-        for op in operations:
-            fund_name = op['fund_name']
-            if fund_name not in funds_operations:
-                funds_operations[fund_name] = []
-            funds_operations[fund_name].append(op)
-        
-        # Calcular PEPS para cada fondo
-        for fund_name, fund_ops in funds_operations.items():
-            # Ordenar operaciones por fecha
-            fund_ops.sort(key=lambda x: x['date'])
-            
-            peps_calc = PEPSCalculator()
-            fund_analysis = {
-                'fund_name': fund_name,
-                'total_purchases': Decimal('0'),
-                'total_sales': Decimal('0'),
-                'total_gain_loss': Decimal('0'),
-                'operations_detail': [],
-                'current_position': {}
-            }
-            
-            for op in fund_ops:
-                if op['operation_type'] in ['SUSCRIPCION', 'COMPRA']:
-                    # Agregar compra al PEPS
-                    peps_calc.add_purchase(op['date'], op['quantity'], op['unit_value'])
-                    fund_analysis['total_purchases'] += op['total_amount']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'COMPRA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount']
-                    })
-                    
-                elif op['operation_type'] in ['RESCATE', 'VENTA']:
-                    # Calcular venta con PEPS
-                    peps_result = peps_calc.calculate_sale(
-                        op['date'], op['quantity'], op['unit_value']
-                    )
-                    
-                    fund_analysis['total_sales'] += op['total_amount']
-                    fund_analysis['total_gain_loss'] += peps_result['gain_loss']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'VENTA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount'],
-                        'cost_basis': peps_result['cost_basis'],
-                        'gain_loss': peps_result['gain_loss'],
-                        'used_lots': peps_result.get('used_lots', [])
-                    })
-            
-            # Posición actual
-            fund_analysis['current_position'] = peps_calc.get_current_position()
-            funds_analysis[fund_name] = fund_analysis
-        
-        return funds_analysis
-    
-    def _parse_date(self, date_str: str) -> str:
-        """Convertir fecha a formato ISO"""
-        try:
-            # Intentar formato DD/MM/YYYY
-            if '/' in date_str:
-                parts = date_str.split('/')
-                if len(parts) == 3:
-                    day, month, year = parts
-                    # Validar año
-                    if len(year) == 2:
-                        year = '20' + year if int(year) < 50 else '19' + year
-                    
-                    date_obj = datetime(int(year), int(month), int(day))
-                    return date_obj.strftime('%Y-%m-%d')
-        except (ValueError, IndexError):
-            pass
-        
-        return date_str
-    
-    def process_pdf(self, pdf_path: str) -> Dict:
-        """Procesar PDF completo y retornar operaciones, posiciones y análisis PEPS"""
-        try:
-            text = self.extract_text(pdf_path)
-            if not text.strip():
-                raise Exception("No se pudo extraer texto del PDF")
-            
-            # Parsear con método específico para FIMA
-            parsed_data = self.parse_fima_operations(text, os.path.basename(pdf_path))
-            operations = parsed_data['operations']
-            positions = parsed_data['positions']
-            
-            # Calcular análisis PEPS
-            peps_analysis = self.calculate_peps_analysis(operations)
-            
-            return {
-                'success': True,
-                'operations': operations,
-                'positions': positions,
-                'peps_analysis': peps_analysis,
-                'total_operations': len(operations),
-                'total_positions': len(positions),
-                'pdf_source': os.path.basename(pdf_path)
-            }
-            
-        except Exception as e:
-            logger.error(f"Error procesando PDF {pdf_path}: {e}")
-            return {
-                'success': False,
-                'error': str(e),
-                'operations': [],
-                'positions': [],
-                'peps_analysis': {}
-            } in part or re.match(r'^[\d.,]+
-    
-    def calculate_peps_analysis(self, operations: List[Dict]) -> Dict:
-        """Calcular análisis PEPS para cada fondo"""
-        funds_analysis = {}
-        
-        # Agrupar operaciones por fondo
-        funds_operations = {}
-        for op in operations:
-            fund_name = op['fund_name']
-            if fund_name not in funds_operations:
-                funds_operations[fund_name] = []
-            funds_operations[fund_name].append(op)
-        
-        # Calcular PEPS para cada fondo
-        for fund_name, fund_ops in funds_operations.items():
-            # Ordenar operaciones por fecha
-            fund_ops.sort(key=lambda x: x['date'])
-            
-            peps_calc = PEPSCalculator()
-            fund_analysis = {
-                'fund_name': fund_name,
-                'total_purchases': Decimal('0'),
-                'total_sales': Decimal('0'),
-                'total_gain_loss': Decimal('0'),
-                'operations_detail': [],
-                'current_position': {}
-            }
-            
-            for op in fund_ops:
-                if op['operation_type'] in ['SUSCRIPCION', 'COMPRA']:
-                    # Agregar compra al PEPS
-                    peps_calc.add_purchase(op['date'], op['quantity'], op['unit_value'])
-                    fund_analysis['total_purchases'] += op['total_amount']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'COMPRA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount']
-                    })
-                    
-                elif op['operation_type'] in ['RESCATE', 'VENTA']:
-                    # Calcular venta con PEPS
-                    peps_result = peps_calc.calculate_sale(
-                        op['date'], op['quantity'], op['unit_value']
-                    )
-                    
-                    fund_analysis['total_sales'] += op['total_amount']
-                    fund_analysis['total_gain_loss'] += peps_result['gain_loss']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'VENTA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount'],
-                        'cost_basis': peps_result['cost_basis'],
-                        'gain_loss': peps_result['gain_loss'],
-                        'used_lots': peps_result.get('used_lots', [])
-                    })
-            
-            # Posición actual
-            fund_analysis['current_position'] = peps_calc.get_current_position()
-            funds_analysis[fund_name] = fund_analysis
-        
-        return funds_analysis
-    
-    def _parse_date(self, date_str: str) -> str:
-        """Convertir fecha a formato ISO"""
-        try:
-            # Intentar formato DD/MM/YYYY
-            if '/' in date_str:
-                parts = date_str.split('/')
-                if len(parts) == 3:
-                    day, month, year = parts
-                    # Validar año
-                    if len(year) == 2:
-                        year = '20' + year if int(year) < 50 else '19' + year
-                    
-                    date_obj = datetime(int(year), int(month), int(day))
-                    return date_obj.strftime('%Y-%m-%d')
-        except (ValueError, IndexError):
-            pass
-        
-        return date_str
-    
-    def process_pdf(self, pdf_path: str) -> Dict:
-        """Procesar PDF completo y retornar operaciones, posiciones y análisis PEPS"""
-        try:
-            text = self.extract_text(pdf_path)
-            if not text.strip():
-                raise Exception("No se pudo extraer texto del PDF")
-            
-            # Parsear con método específico para FIMA
-            parsed_data = self.parse_fima_operations(text, os.path.basename(pdf_path))
-            operations = parsed_data['operations']
-            positions = parsed_data['positions']
-            
-            # Calcular análisis PEPS
-            peps_analysis = self.calculate_peps_analysis(operations)
-            
-            return {
-                'success': True,
-                'operations': operations,
-                'positions': positions,
-                'peps_analysis': peps_analysis,
-                'total_operations': len(operations),
-                'total_positions': len(positions),
-                'pdf_source': os.path.basename(pdf_path)
-            }
-            
-        except Exception as e:
-            logger.error(f"Error procesando PDF {pdf_path}: {e}")
-            return {
-                'success': False,
-                'error': str(e),
-                'operations': [],
-                'positions': [],
-                'peps_analysis': {}
-            }, part):
-                                    clean_part = part.replace('
-    
-    def calculate_peps_analysis(self, operations: List[Dict]) -> Dict:
-        """Calcular análisis PEPS para cada fondo"""
-        funds_analysis = {}
-        
-        # Agrupar operaciones por fondo
-        funds_operations = {}
-        for op in operations:
-            fund_name = op['fund_name']
-            if fund_name not in funds_operations:
-                funds_operations[fund_name] = []
-            funds_operations[fund_name].append(op)
-        
-        # Calcular PEPS para cada fondo
-        for fund_name, fund_ops in funds_operations.items():
-            # Ordenar operaciones por fecha
-            fund_ops.sort(key=lambda x: x['date'])
-            
-            peps_calc = PEPSCalculator()
-            fund_analysis = {
-                'fund_name': fund_name,
-                'total_purchases': Decimal('0'),
-                'total_sales': Decimal('0'),
-                'total_gain_loss': Decimal('0'),
-                'operations_detail': [],
-                'current_position': {}
-            }
-            
-            for op in fund_ops:
-                if op['operation_type'] in ['SUSCRIPCION', 'COMPRA']:
-                    # Agregar compra al PEPS
-                    peps_calc.add_purchase(op['date'], op['quantity'], op['unit_value'])
-                    fund_analysis['total_purchases'] += op['total_amount']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'COMPRA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount']
-                    })
-                    
-                elif op['operation_type'] in ['RESCATE', 'VENTA']:
-                    # Calcular venta con PEPS
-                    peps_result = peps_calc.calculate_sale(
-                        op['date'], op['quantity'], op['unit_value']
-                    )
-                    
-                    fund_analysis['total_sales'] += op['total_amount']
-                    fund_analysis['total_gain_loss'] += peps_result['gain_loss']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'VENTA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount'],
-                        'cost_basis': peps_result['cost_basis'],
-                        'gain_loss': peps_result['gain_loss'],
-                        'used_lots': peps_result.get('used_lots', [])
-                    })
-            
-            # Posición actual
-            fund_analysis['current_position'] = peps_calc.get_current_position()
-            funds_analysis[fund_name] = fund_analysis
-        
-        return funds_analysis
-    
-    def _parse_date(self, date_str: str) -> str:
-        """Convertir fecha a formato ISO"""
-        try:
-            # Intentar formato DD/MM/YYYY
-            if '/' in date_str:
-                parts = date_str.split('/')
-                if len(parts) == 3:
-                    day, month, year = parts
-                    # Validar año
-                    if len(year) == 2:
-                        year = '20' + year if int(year) < 50 else '19' + year
-                    
-                    date_obj = datetime(int(year), int(month), int(day))
-                    return date_obj.strftime('%Y-%m-%d')
-        except (ValueError, IndexError):
-            pass
-        
-        return date_str
-    
-    def process_pdf(self, pdf_path: str) -> Dict:
-        """Procesar PDF completo y retornar operaciones, posiciones y análisis PEPS"""
-        try:
-            text = self.extract_text(pdf_path)
-            if not text.strip():
-                raise Exception("No se pudo extraer texto del PDF")
-            
-            # Parsear con método específico para FIMA
-            parsed_data = self.parse_fima_operations(text, os.path.basename(pdf_path))
-            operations = parsed_data['operations']
-            positions = parsed_data['positions']
-            
-            # Calcular análisis PEPS
-            peps_analysis = self.calculate_peps_analysis(operations)
-            
-            return {
-                'success': True,
-                'operations': operations,
-                'positions': positions,
-                'peps_analysis': peps_analysis,
-                'total_operations': len(operations),
-                'total_positions': len(positions),
-                'pdf_source': os.path.basename(pdf_path)
-            }
-            
-        except Exception as e:
-            logger.error(f"Error procesando PDF {pdf_path}: {e}")
-            return {
-                'success': False,
-                'error': str(e),
-                'operations': [],
-                'positions': [],
-                'peps_analysis': {}
-            }, '').strip()
-                                    if clean_part and clean_part != ',':
-                                        numeric_parts.append(clean_part)
-                            
-                            # Necesitamos al menos 3 valores numéricos: cantidad, valor unitario, monto total
-                            if len(numeric_parts) >= 3:
-                                quantity = self.clean_amount(numeric_parts[0])
-                                unit_value = self.clean_amount(numeric_parts[1])
-                                total_amount = self.clean_amount(numeric_parts[2])
-                                
-                                # Validar que los valores sean razonables
-                                if quantity > 0 and unit_value > 0 and total_amount > 0:
-                                    operation = {
-                                        'date': date,
-                                        'operation_type': operation_type,
-                                        'fund_name': current_fund,
-                                        'fund_type': 'Money Market' if 'FIMA' in current_fund else 'Otro',
-                                        'quantity': quantity,
-                                        'unit_value': unit_value,
-                                        'total_amount': total_amount,
-                                        'description': f"{operation_type} - {current_fund}",
-                                        'pdf_source': pdf_source
-                                    }
-                                    operations.append(operation)
-                                    logger.info(f"Operación parseada: {date} {operation_type} {quantity} cuotas a ${unit_value} = ${total_amount}")
-                                else:
-                                    logger.warning(f"Valores inválidos en línea {i}: cantidad={quantity}, valor={unit_value}, total={total_amount}")
-                            else:
-                                logger.warning(f"Insuficientes valores numéricos en línea {i}: {numeric_parts}")
-                        else:
-                            logger.warning(f"Línea con formato inesperado en línea {i}: {len(parts)} partes - {line}")
-                    
-                    except Exception as e:
-                        logger.warning(f"Error parseando operación en línea {i}: {e} - Línea: {line}")
-                        continue
-        
-        logger.info(f"Parsing completado: {len(operations)} operaciones, {len(positions)} posiciones")
-        
-        return {
-            'operations': operations,
-            'positions': positions
-        }
-    
-    def calculate_peps_analysis(self, operations: List[Dict]) -> Dict:
-        """Calcular análisis PEPS para cada fondo"""
-        funds_analysis = {}
-        
-        # Agrupar operaciones por fondo
-        funds_operations = {}
-        for op in operations:
-            fund_name = op['fund_name']
-            if fund_name not in funds_operations:
-                funds_operations[fund_name] = []
-            funds_operations[fund_name].append(op)
-        
-        # Calcular PEPS para cada fondo
-        for fund_name, fund_ops in funds_operations.items():
-            # Ordenar operaciones por fecha
-            fund_ops.sort(key=lambda x: x['date'])
-            
-            peps_calc = PEPSCalculator()
-            fund_analysis = {
-                'fund_name': fund_name,
-                'total_purchases': Decimal('0'),
-                'total_sales': Decimal('0'),
-                'total_gain_loss': Decimal('0'),
-                'operations_detail': [],
-                'current_position': {}
-            }
-            
-            for op in fund_ops:
-                if op['operation_type'] in ['SUSCRIPCION', 'COMPRA']:
-                    # Agregar compra al PEPS
-                    peps_calc.add_purchase(op['date'], op['quantity'], op['unit_value'])
-                    fund_analysis['total_purchases'] += op['total_amount']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'COMPRA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount']
-                    })
-                    
-                elif op['operation_type'] in ['RESCATE', 'VENTA']:
-                    # Calcular venta con PEPS
-                    peps_result = peps_calc.calculate_sale(
-                        op['date'], op['quantity'], op['unit_value']
-                    )
-                    
-                    fund_analysis['total_sales'] += op['total_amount']
-                    fund_analysis['total_gain_loss'] += peps_result['gain_loss']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'VENTA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount'],
-                        'cost_basis': peps_result['cost_basis'],
-                        'gain_loss': peps_result['gain_loss'],
-                        'used_lots': peps_result.get('used_lots', [])
-                    })
-            
-            # Posición actual
-            fund_analysis['current_position'] = peps_calc.get_current_position()
-            funds_analysis[fund_name] = fund_analysis
-        
-        return funds_analysis
-    
-    def _parse_date(self, date_str: str) -> str:
-        """Convertir fecha a formato ISO"""
-        try:
-            # Intentar formato DD/MM/YYYY
-            if '/' in date_str:
-                parts = date_str.split('/')
-                if len(parts) == 3:
-                    day, month, year = parts
-                    # Validar año
-                    if len(year) == 2:
-                        year = '20' + year if int(year) < 50 else '19' + year
-                    
-                    date_obj = datetime(int(year), int(month), int(day))
-                    return date_obj.strftime('%Y-%m-%d')
-        except (ValueError, IndexError):
-            pass
-        
-        return date_str
-    
-    def process_pdf(self, pdf_path: str) -> Dict:
-        """Procesar PDF completo y retornar operaciones, posiciones y análisis PEPS"""
-        try:
-            text = self.extract_text(pdf_path)
-            if not text.strip():
-                raise Exception("No se pudo extraer texto del PDF")
-            
-            # Parsear con método específico para FIMA
-            parsed_data = self.parse_fima_operations(text, os.path.basename(pdf_path))
-            operations = parsed_data['operations']
-            positions = parsed_data['positions']
-            
-            # Calcular análisis PEPS
-            peps_analysis = self.calculate_peps_analysis(operations)
-            
-            return {
-                'success': True,
-                'operations': operations,
-                'positions': positions,
-                'peps_analysis': peps_analysis,
-                'total_operations': len(operations),
-                'total_positions': len(positions),
-                'pdf_source': os.path.basename(pdf_path)
-            }
-            
-        except Exception as e:
-            logger.error(f"Error procesando PDF {pdf_path}: {e}")
-            return {
-                'success': False,
-                'error': str(e),
-                'operations': [],
-                'positions': [],
-                'peps_analysis': {}
-            }) >= 2:
-                    try:
-                        # Dividir por $ para obtener las partes
-                        parts = [p.strip() for p in line.split('
-    
-    def calculate_peps_analysis(self, operations: List[Dict]) -> Dict:
-        """Calcular análisis PEPS para cada fondo"""
-        funds_analysis = {}
-        
-        # Agrupar operaciones por fondo
-        funds_operations = {}
-        for op in operations:
-            fund_name = op['fund_name']
-            if fund_name not in funds_operations:
-                funds_operations[fund_name] = []
-            funds_operations[fund_name].append(op)
-        
-        # Calcular PEPS para cada fondo
-        for fund_name, fund_ops in funds_operations.items():
-            # Ordenar operaciones por fecha
-            fund_ops.sort(key=lambda x: x['date'])
-            
-            peps_calc = PEPSCalculator()
-            fund_analysis = {
-                'fund_name': fund_name,
-                'total_purchases': Decimal('0'),
-                'total_sales': Decimal('0'),
-                'total_gain_loss': Decimal('0'),
-                'operations_detail': [],
-                'current_position': {}
-            }
-            
-            for op in fund_ops:
-                if op['operation_type'] in ['SUSCRIPCION', 'COMPRA']:
-                    # Agregar compra al PEPS
-                    peps_calc.add_purchase(op['date'], op['quantity'], op['unit_value'])
-                    fund_analysis['total_purchases'] += op['total_amount']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'COMPRA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount']
-                    })
-                    
-                elif op['operation_type'] in ['RESCATE', 'VENTA']:
-                    # Calcular venta con PEPS
-                    peps_result = peps_calc.calculate_sale(
-                        op['date'], op['quantity'], op['unit_value']
-                    )
-                    
-                    fund_analysis['total_sales'] += op['total_amount']
-                    fund_analysis['total_gain_loss'] += peps_result['gain_loss']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'VENTA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount'],
-                        'cost_basis': peps_result['cost_basis'],
-                        'gain_loss': peps_result['gain_loss'],
-                        'used_lots': peps_result.get('used_lots', [])
-                    })
-            
-            # Posición actual
-            fund_analysis['current_position'] = peps_calc.get_current_position()
-            funds_analysis[fund_name] = fund_analysis
-        
-        return funds_analysis
-    
-    def _parse_date(self, date_str: str) -> str:
-        """Convertir fecha a formato ISO"""
-        try:
-            # Intentar formato DD/MM/YYYY
-            if '/' in date_str:
-                parts = date_str.split('/')
-                if len(parts) == 3:
-                    day, month, year = parts
-                    # Validar año
-                    if len(year) == 2:
-                        year = '20' + year if int(year) < 50 else '19' + year
-                    
-                    date_obj = datetime(int(year), int(month), int(day))
-                    return date_obj.strftime('%Y-%m-%d')
-        except (ValueError, IndexError):
-            pass
-        
-        return date_str
-    
-    def process_pdf(self, pdf_path: str) -> Dict:
-        """Procesar PDF completo y retornar operaciones, posiciones y análisis PEPS"""
-        try:
-            text = self.extract_text(pdf_path)
-            if not text.strip():
-                raise Exception("No se pudo extraer texto del PDF")
-            
-            # Parsear con método específico para FIMA
-            parsed_data = self.parse_fima_operations(text, os.path.basename(pdf_path))
-            operations = parsed_data['operations']
-            positions = parsed_data['positions']
-            
-            # Calcular análisis PEPS
-            peps_analysis = self.calculate_peps_analysis(operations)
-            
-            return {
-                'success': True,
-                'operations': operations,
-                'positions': positions,
-                'peps_analysis': peps_analysis,
-                'total_operations': len(operations),
-                'total_positions': len(positions),
-                'pdf_source': os.path.basename(pdf_path)
-            }
-            
-        except Exception as e:
-            logger.error(f"Error procesando PDF {pdf_path}: {e}")
-            return {
-                'success': False,
-                'error': str(e),
-                'operations': [],
-                'positions': [],
-                'peps_analysis': {}
-            } in line and line.count('
-    
-    def calculate_peps_analysis(self, operations: List[Dict]) -> Dict:
-        """Calcular análisis PEPS para cada fondo"""
-        funds_analysis = {}
-        
-        # Agrupar operaciones por fondo
-        funds_operations = {}
-        for op in operations:
-            fund_name = op['fund_name']
-            if fund_name not in funds_operations:
-                funds_operations[fund_name] = []
-            funds_operations[fund_name].append(op)
-        
-        # Calcular PEPS para cada fondo
-        for fund_name, fund_ops in funds_operations.items():
-            # Ordenar operaciones por fecha
-            fund_ops.sort(key=lambda x: x['date'])
-            
-            peps_calc = PEPSCalculator()
-            fund_analysis = {
-                'fund_name': fund_name,
-                'total_purchases': Decimal('0'),
-                'total_sales': Decimal('0'),
-                'total_gain_loss': Decimal('0'),
-                'operations_detail': [],
-                'current_position': {}
-            }
-            
-            for op in fund_ops:
-                if op['operation_type'] in ['SUSCRIPCION', 'COMPRA']:
-                    # Agregar compra al PEPS
-                    peps_calc.add_purchase(op['date'], op['quantity'], op['unit_value'])
-                    fund_analysis['total_purchases'] += op['total_amount']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'COMPRA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount']
-                    })
-                    
-                elif op['operation_type'] in ['RESCATE', 'VENTA']:
-                    # Calcular venta con PEPS
-                    peps_result = peps_calc.calculate_sale(
-                        op['date'], op['quantity'], op['unit_value']
-                    )
-                    
-                    fund_analysis['total_sales'] += op['total_amount']
-                    fund_analysis['total_gain_loss'] += peps_result['gain_loss']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'VENTA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount'],
-                        'cost_basis': peps_result['cost_basis'],
-                        'gain_loss': peps_result['gain_loss'],
-                        'used_lots': peps_result.get('used_lots', [])
-                    })
-            
-            # Posición actual
-            fund_analysis['current_position'] = peps_calc.get_current_position()
-            funds_analysis[fund_name] = fund_analysis
-        
-        return funds_analysis
-    
-    def _parse_date(self, date_str: str) -> str:
-        """Convertir fecha a formato ISO"""
-        try:
-            # Intentar formato DD/MM/YYYY
-            if '/' in date_str:
-                parts = date_str.split('/')
-                if len(parts) == 3:
-                    day, month, year = parts
-                    # Validar año
-                    if len(year) == 2:
-                        year = '20' + year if int(year) < 50 else '19' + year
-                    
-                    date_obj = datetime(int(year), int(month), int(day))
-                    return date_obj.strftime('%Y-%m-%d')
-        except (ValueError, IndexError):
-            pass
-        
-        return date_str
-    
-    def process_pdf(self, pdf_path: str) -> Dict:
-        """Procesar PDF completo y retornar operaciones, posiciones y análisis PEPS"""
-        try:
-            text = self.extract_text(pdf_path)
-            if not text.strip():
-                raise Exception("No se pudo extraer texto del PDF")
-            
-            # Parsear con método específico para FIMA
-            parsed_data = self.parse_fima_operations(text, os.path.basename(pdf_path))
-            operations = parsed_data['operations']
-            positions = parsed_data['positions']
-            
-            # Calcular análisis PEPS
-            peps_analysis = self.calculate_peps_analysis(operations)
-            
-            return {
-                'success': True,
-                'operations': operations,
-                'positions': positions,
-                'peps_analysis': peps_analysis,
-                'total_operations': len(operations),
-                'total_positions': len(positions),
-                'pdf_source': os.path.basename(pdf_path)
-            }
-            
-        except Exception as e:
-            logger.error(f"Error procesando PDF {pdf_path}: {e}")
-            return {
-                'success': False,
-                'error': str(e),
-                'operations': [],
-                'positions': [],
-                'peps_analysis': {}
-            }) >= 2:
-                    try:
-                        # Dividir por $ para obtener las partes
-                        parts = line.split('
-    
-    def calculate_peps_analysis(self, operations: List[Dict]) -> Dict:
-        """Calcular análisis PEPS para cada fondo"""
-        funds_analysis = {}
-        
-        # Agrupar operaciones por fondo
-        funds_operations = {}
-        for op in operations:
-            fund_name = op['fund_name']
-            if fund_name not in funds_operations:
-                funds_operations[fund_name] = []
-            funds_operations[fund_name].append(op)
-        
-        # Calcular PEPS para cada fondo
-        for fund_name, fund_ops in funds_operations.items():
-            # Ordenar operaciones por fecha
-            fund_ops.sort(key=lambda x: x['date'])
-            
-            peps_calc = PEPSCalculator()
-            fund_analysis = {
-                'fund_name': fund_name,
-                'total_purchases': Decimal('0'),
-                'total_sales': Decimal('0'),
-                'total_gain_loss': Decimal('0'),
-                'operations_detail': [],
-                'current_position': {}
-            }
-            
-            for op in fund_ops:
-                if op['operation_type'] in ['SUSCRIPCION', 'COMPRA']:
-                    # Agregar compra al PEPS
-                    peps_calc.add_purchase(op['date'], op['quantity'], op['unit_value'])
-                    fund_analysis['total_purchases'] += op['total_amount']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'COMPRA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount']
-                    })
-                    
-                elif op['operation_type'] in ['RESCATE', 'VENTA']:
-                    # Calcular venta con PEPS
-                    peps_result = peps_calc.calculate_sale(
-                        op['date'], op['quantity'], op['unit_value']
-                    )
-                    
-                    fund_analysis['total_sales'] += op['total_amount']
-                    fund_analysis['total_gain_loss'] += peps_result['gain_loss']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'VENTA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount'],
-                        'cost_basis': peps_result['cost_basis'],
-                        'gain_loss': peps_result['gain_loss'],
-                        'used_lots': peps_result.get('used_lots', [])
-                    })
-            
-            # Posición actual
-            fund_analysis['current_position'] = peps_calc.get_current_position()
-            funds_analysis[fund_name] = fund_analysis
-        
-        return funds_analysis
-    
-    def _parse_date(self, date_str: str) -> str:
-        """Convertir fecha a formato ISO"""
-        try:
-            # Intentar formato DD/MM/YYYY
-            if '/' in date_str:
-                parts = date_str.split('/')
-                if len(parts) == 3:
-                    day, month, year = parts
-                    # Validar año
-                    if len(year) == 2:
-                        year = '20' + year if int(year) < 50 else '19' + year
-                    
-                    date_obj = datetime(int(year), int(month), int(day))
-                    return date_obj.strftime('%Y-%m-%d')
-        except (ValueError, IndexError):
-            pass
-        
-        return date_str
-    
-    def process_pdf(self, pdf_path: str) -> Dict:
-        """Procesar PDF completo y retornar operaciones, posiciones y análisis PEPS"""
-        try:
-            text = self.extract_text(pdf_path)
-            if not text.strip():
-                raise Exception("No se pudo extraer texto del PDF")
-            
-            # Parsear con método específico para FIMA
-            parsed_data = self.parse_fima_operations(text, os.path.basename(pdf_path))
-            operations = parsed_data['operations']
-            positions = parsed_data['positions']
-            
-            # Calcular análisis PEPS
-            peps_analysis = self.calculate_peps_analysis(operations)
-            
-            return {
-                'success': True,
-                'operations': operations,
-                'positions': positions,
-                'peps_analysis': peps_analysis,
-                'total_operations': len(operations),
-                'total_positions': len(positions),
-                'pdf_source': os.path.basename(pdf_path)
-            }
-            
-        except Exception as e:
-            logger.error(f"Error procesando PDF {pdf_path}: {e}")
-            return {
-                'success': False,
-                'error': str(e),
-                'operations': [],
-                'positions': [],
-                'peps_analysis': {}
-            })
-                        if len(parts) >= 3:
-                            # Extraer nombre del fondo (antes del primer número)
-                            fund_name_part = parts[0].strip()
-                            # Remover números al final del nombre del fondo
-                            fund_name_match = re.match(r'^(.+?)\s+([\d.,]+)
-    
-    def calculate_peps_analysis(self, operations: List[Dict]) -> Dict:
-        """Calcular análisis PEPS para cada fondo"""
-        funds_analysis = {}
-        
-        # Agrupar operaciones por fondo
-        funds_operations = {}
-        for op in operations:
-            fund_name = op['fund_name']
-            if fund_name not in funds_operations:
-                funds_operations[fund_name] = []
-            funds_operations[fund_name].append(op)
-        
-        # Calcular PEPS para cada fondo
-        for fund_name, fund_ops in funds_operations.items():
-            # Ordenar operaciones por fecha
-            fund_ops.sort(key=lambda x: x['date'])
-            
-            peps_calc = PEPSCalculator()
-            fund_analysis = {
-                'fund_name': fund_name,
-                'total_purchases': Decimal('0'),
-                'total_sales': Decimal('0'),
-                'total_gain_loss': Decimal('0'),
-                'operations_detail': [],
-                'current_position': {}
-            }
-            
-            for op in fund_ops:
-                if op['operation_type'] in ['SUSCRIPCION', 'COMPRA']:
-                    # Agregar compra al PEPS
-                    peps_calc.add_purchase(op['date'], op['quantity'], op['unit_value'])
-                    fund_analysis['total_purchases'] += op['total_amount']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'COMPRA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount']
-                    })
-                    
-                elif op['operation_type'] in ['RESCATE', 'VENTA']:
-                    # Calcular venta con PEPS
-                    peps_result = peps_calc.calculate_sale(
-                        op['date'], op['quantity'], op['unit_value']
-                    )
-                    
-                    fund_analysis['total_sales'] += op['total_amount']
-                    fund_analysis['total_gain_loss'] += peps_result['gain_loss']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'VENTA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount'],
-                        'cost_basis': peps_result['cost_basis'],
-                        'gain_loss': peps_result['gain_loss'],
-                        'used_lots': peps_result.get('used_lots', [])
-                    })
-            
-            # Posición actual
-            fund_analysis['current_position'] = peps_calc.get_current_position()
-            funds_analysis[fund_name] = fund_analysis
-        
-        return funds_analysis
-    
-    def _parse_date(self, date_str: str) -> str:
-        """Convertir fecha a formato ISO"""
-        try:
-            # Intentar formato DD/MM/YYYY
-            if '/' in date_str:
-                parts = date_str.split('/')
-                if len(parts) == 3:
-                    day, month, year = parts
-                    # Validar año
-                    if len(year) == 2:
-                        year = '20' + year if int(year) < 50 else '19' + year
-                    
-                    date_obj = datetime(int(year), int(month), int(day))
-                    return date_obj.strftime('%Y-%m-%d')
-        except (ValueError, IndexError):
-            pass
-        
-        return date_str
-    
-    def process_pdf(self, pdf_path: str) -> Dict:
-        """Procesar PDF completo y retornar operaciones, posiciones y análisis PEPS"""
-        try:
-            text = self.extract_text(pdf_path)
-            if not text.strip():
-                raise Exception("No se pudo extraer texto del PDF")
-            
-            # Parsear con método específico para FIMA
-            parsed_data = self.parse_fima_operations(text, os.path.basename(pdf_path))
-            operations = parsed_data['operations']
-            positions = parsed_data['positions']
-            
-            # Calcular análisis PEPS
-            peps_analysis = self.calculate_peps_analysis(operations)
-            
-            return {
-                'success': True,
-                'operations': operations,
-                'positions': positions,
-                'peps_analysis': peps_analysis,
-                'total_operations': len(operations),
-                'total_positions': len(positions),
-                'pdf_source': os.path.basename(pdf_path)
-            }
-            
-        except Exception as e:
-            logger.error(f"Error procesando PDF {pdf_path}: {e}")
-            return {
-                'success': False,
-                'error': str(e),
-                'operations': [],
-                'positions': [],
-                'peps_analysis': {}
-            }, fund_name_part)
-                            if fund_name_match:
-                                fund_name = fund_name_match.group(1).strip()
-                                quantity_str = fund_name_match.group(2).strip()
-                            else:
-                                # Fallback: usar todo como nombre del fondo
-                                fund_name = fund_name_part
-                                quantity_str = '0'
-                            
-                            # Extraer valor unitario y valor total
-                            unit_value_str = parts[1].strip()
-                            total_value_str = parts[2].strip()
-                            
-                            position = {
-                                'fund_name': fund_name,
-                                'fund_type': 'Money Market' if 'FIMA' in fund_name else 'Otro',
-                                'quantity': self.clean_amount(quantity_str),
-                                'unit_value': self.clean_amount(unit_value_str),
-                                'total_value': self.clean_amount(total_value_str)
-                            }
-                            positions.append(position)
-                            logger.info(f"Posición parseada: {fund_name} - {quantity_str} cuotas")
-                    
-                    except Exception as e:
-                        logger.warning(f"Error parseando posición en línea {i}: {e} - Línea: {line}")
-                        continue
-            
-            # Parsear operaciones con lógica mejorada
-            if parsing_operations and current_fund:
-                # Verificar si la línea contiene una fecha al inicio
-                date_match = re.match(r'^(\d{2}/\d{2}/\d{4})', line)
-                if date_match:
-                    try:
-                        # Dividir la línea por espacios/tabulaciones, manteniendo los signos $
-                        parts = line.split()
-                        
-                        if len(parts) >= 6:  # Necesitamos al menos fecha, tipo, cantidad, $, valor, $, monto, fecha
-                            date = self._parse_date(parts[0])
-                            operation_type = parts[1].upper()
-                            
-                            # Encontrar las partes numéricas (buscar patrones con $)
-                            numeric_parts = []
-                            for j, part in enumerate(parts[2:], 2):  # Empezar desde el índice 2
-                                if '
-    
-    def calculate_peps_analysis(self, operations: List[Dict]) -> Dict:
-        """Calcular análisis PEPS para cada fondo"""
-        funds_analysis = {}
-        
-        # Agrupar operaciones por fondo
-        funds_operations = {}
-        for op in operations:
-            fund_name = op['fund_name']
-            if fund_name not in funds_operations:
-                funds_operations[fund_name] = []
-            funds_operations[fund_name].append(op)
-        
-        # Calcular PEPS para cada fondo
-        for fund_name, fund_ops in funds_operations.items():
-            # Ordenar operaciones por fecha
-            fund_ops.sort(key=lambda x: x['date'])
-            
-            peps_calc = PEPSCalculator()
-            fund_analysis = {
-                'fund_name': fund_name,
-                'total_purchases': Decimal('0'),
-                'total_sales': Decimal('0'),
-                'total_gain_loss': Decimal('0'),
-                'operations_detail': [],
-                'current_position': {}
-            }
-            
-            for op in fund_ops:
-                if op['operation_type'] in ['SUSCRIPCION', 'COMPRA']:
-                    # Agregar compra al PEPS
-                    peps_calc.add_purchase(op['date'], op['quantity'], op['unit_value'])
-                    fund_analysis['total_purchases'] += op['total_amount']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'COMPRA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount']
-                    })
-                    
-                elif op['operation_type'] in ['RESCATE', 'VENTA']:
-                    # Calcular venta con PEPS
-                    peps_result = peps_calc.calculate_sale(
-                        op['date'], op['quantity'], op['unit_value']
-                    )
-                    
-                    fund_analysis['total_sales'] += op['total_amount']
-                    fund_analysis['total_gain_loss'] += peps_result['gain_loss']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'VENTA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount'],
-                        'cost_basis': peps_result['cost_basis'],
-                        'gain_loss': peps_result['gain_loss'],
-                        'used_lots': peps_result.get('used_lots', [])
-                    })
-            
-            # Posición actual
-            fund_analysis['current_position'] = peps_calc.get_current_position()
-            funds_analysis[fund_name] = fund_analysis
-        
-        return funds_analysis
-    
-    def _parse_date(self, date_str: str) -> str:
-        """Convertir fecha a formato ISO"""
-        try:
-            # Intentar formato DD/MM/YYYY
-            if '/' in date_str:
-                parts = date_str.split('/')
-                if len(parts) == 3:
-                    day, month, year = parts
-                    # Validar año
-                    if len(year) == 2:
-                        year = '20' + year if int(year) < 50 else '19' + year
-                    
-                    date_obj = datetime(int(year), int(month), int(day))
-                    return date_obj.strftime('%Y-%m-%d')
-        except (ValueError, IndexError):
-            pass
-        
-        return date_str
-    
-    def process_pdf(self, pdf_path: str) -> Dict:
-        """Procesar PDF completo y retornar operaciones, posiciones y análisis PEPS"""
-        try:
-            text = self.extract_text(pdf_path)
-            if not text.strip():
-                raise Exception("No se pudo extraer texto del PDF")
-            
-            # Parsear con método específico para FIMA
-            parsed_data = self.parse_fima_operations(text, os.path.basename(pdf_path))
-            operations = parsed_data['operations']
-            positions = parsed_data['positions']
-            
-            # Calcular análisis PEPS
-            peps_analysis = self.calculate_peps_analysis(operations)
-            
-            return {
-                'success': True,
-                'operations': operations,
-                'positions': positions,
-                'peps_analysis': peps_analysis,
-                'total_operations': len(operations),
-                'total_positions': len(positions),
-                'pdf_source': os.path.basename(pdf_path)
-            }
-            
-        except Exception as e:
-            logger.error(f"Error procesando PDF {pdf_path}: {e}")
-            return {
-                'success': False,
-                'error': str(e),
-                'operations': [],
-                'positions': [],
-                'peps_analysis': {}
-            } in part or re.match(r'^[\d.,]+
-    
-    def calculate_peps_analysis(self, operations: List[Dict]) -> Dict:
-        """Calcular análisis PEPS para cada fondo"""
-        funds_analysis = {}
-        
-        # Agrupar operaciones por fondo
-        funds_operations = {}
-        for op in operations:
-            fund_name = op['fund_name']
-            if fund_name not in funds_operations:
-                funds_operations[fund_name] = []
-            funds_operations[fund_name].append(op)
-        
-        # Calcular PEPS para cada fondo
-        for fund_name, fund_ops in funds_operations.items():
-            # Ordenar operaciones por fecha
-            fund_ops.sort(key=lambda x: x['date'])
-            
-            peps_calc = PEPSCalculator()
-            fund_analysis = {
-                'fund_name': fund_name,
-                'total_purchases': Decimal('0'),
-                'total_sales': Decimal('0'),
-                'total_gain_loss': Decimal('0'),
-                'operations_detail': [],
-                'current_position': {}
-            }
-            
-            for op in fund_ops:
-                if op['operation_type'] in ['SUSCRIPCION', 'COMPRA']:
-                    # Agregar compra al PEPS
-                    peps_calc.add_purchase(op['date'], op['quantity'], op['unit_value'])
-                    fund_analysis['total_purchases'] += op['total_amount']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'COMPRA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount']
-                    })
-                    
-                elif op['operation_type'] in ['RESCATE', 'VENTA']:
-                    # Calcular venta con PEPS
-                    peps_result = peps_calc.calculate_sale(
-                        op['date'], op['quantity'], op['unit_value']
-                    )
-                    
-                    fund_analysis['total_sales'] += op['total_amount']
-                    fund_analysis['total_gain_loss'] += peps_result['gain_loss']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'VENTA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount'],
-                        'cost_basis': peps_result['cost_basis'],
-                        'gain_loss': peps_result['gain_loss'],
-                        'used_lots': peps_result.get('used_lots', [])
-                    })
-            
-            # Posición actual
-            fund_analysis['current_position'] = peps_calc.get_current_position()
-            funds_analysis[fund_name] = fund_analysis
-        
-        return funds_analysis
-    
-    def _parse_date(self, date_str: str) -> str:
-        """Convertir fecha a formato ISO"""
-        try:
-            # Intentar formato DD/MM/YYYY
-            if '/' in date_str:
-                parts = date_str.split('/')
-                if len(parts) == 3:
-                    day, month, year = parts
-                    # Validar año
-                    if len(year) == 2:
-                        year = '20' + year if int(year) < 50 else '19' + year
-                    
-                    date_obj = datetime(int(year), int(month), int(day))
-                    return date_obj.strftime('%Y-%m-%d')
-        except (ValueError, IndexError):
-            pass
-        
-        return date_str
-    
-    def process_pdf(self, pdf_path: str) -> Dict:
-        """Procesar PDF completo y retornar operaciones, posiciones y análisis PEPS"""
-        try:
-            text = self.extract_text(pdf_path)
-            if not text.strip():
-                raise Exception("No se pudo extraer texto del PDF")
-            
-            # Parsear con método específico para FIMA
-            parsed_data = self.parse_fima_operations(text, os.path.basename(pdf_path))
-            operations = parsed_data['operations']
-            positions = parsed_data['positions']
-            
-            # Calcular análisis PEPS
-            peps_analysis = self.calculate_peps_analysis(operations)
-            
-            return {
-                'success': True,
-                'operations': operations,
-                'positions': positions,
-                'peps_analysis': peps_analysis,
-                'total_operations': len(operations),
-                'total_positions': len(positions),
-                'pdf_source': os.path.basename(pdf_path)
-            }
-            
-        except Exception as e:
-            logger.error(f"Error procesando PDF {pdf_path}: {e}")
-            return {
-                'success': False,
-                'error': str(e),
-                'operations': [],
-                'positions': [],
-                'peps_analysis': {}
-            }, part):
-                                    clean_part = part.replace('
-    
-    def calculate_peps_analysis(self, operations: List[Dict]) -> Dict:
-        """Calcular análisis PEPS para cada fondo"""
-        funds_analysis = {}
-        
-        # Agrupar operaciones por fondo
-        funds_operations = {}
-        for op in operations:
-            fund_name = op['fund_name']
-            if fund_name not in funds_operations:
-                funds_operations[fund_name] = []
-            funds_operations[fund_name].append(op)
-        
-        # Calcular PEPS para cada fondo
-        for fund_name, fund_ops in funds_operations.items():
-            # Ordenar operaciones por fecha
-            fund_ops.sort(key=lambda x: x['date'])
-            
-            peps_calc = PEPSCalculator()
-            fund_analysis = {
-                'fund_name': fund_name,
-                'total_purchases': Decimal('0'),
-                'total_sales': Decimal('0'),
-                'total_gain_loss': Decimal('0'),
-                'operations_detail': [],
-                'current_position': {}
-            }
-            
-            for op in fund_ops:
-                if op['operation_type'] in ['SUSCRIPCION', 'COMPRA']:
-                    # Agregar compra al PEPS
-                    peps_calc.add_purchase(op['date'], op['quantity'], op['unit_value'])
-                    fund_analysis['total_purchases'] += op['total_amount']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'COMPRA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount']
-                    })
-                    
-                elif op['operation_type'] in ['RESCATE', 'VENTA']:
-                    # Calcular venta con PEPS
-                    peps_result = peps_calc.calculate_sale(
-                        op['date'], op['quantity'], op['unit_value']
-                    )
-                    
-                    fund_analysis['total_sales'] += op['total_amount']
-                    fund_analysis['total_gain_loss'] += peps_result['gain_loss']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'VENTA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount'],
-                        'cost_basis': peps_result['cost_basis'],
-                        'gain_loss': peps_result['gain_loss'],
-                        'used_lots': peps_result.get('used_lots', [])
-                    })
-            
-            # Posición actual
-            fund_analysis['current_position'] = peps_calc.get_current_position()
-            funds_analysis[fund_name] = fund_analysis
-        
-        return funds_analysis
-    
-    def _parse_date(self, date_str: str) -> str:
-        """Convertir fecha a formato ISO"""
-        try:
-            # Intentar formato DD/MM/YYYY
-            if '/' in date_str:
-                parts = date_str.split('/')
-                if len(parts) == 3:
-                    day, month, year = parts
-                    # Validar año
-                    if len(year) == 2:
-                        year = '20' + year if int(year) < 50 else '19' + year
-                    
-                    date_obj = datetime(int(year), int(month), int(day))
-                    return date_obj.strftime('%Y-%m-%d')
-        except (ValueError, IndexError):
-            pass
-        
-        return date_str
-    
-    def process_pdf(self, pdf_path: str) -> Dict:
-        """Procesar PDF completo y retornar operaciones, posiciones y análisis PEPS"""
-        try:
-            text = self.extract_text(pdf_path)
-            if not text.strip():
-                raise Exception("No se pudo extraer texto del PDF")
-            
-            # Parsear con método específico para FIMA
-            parsed_data = self.parse_fima_operations(text, os.path.basename(pdf_path))
-            operations = parsed_data['operations']
-            positions = parsed_data['positions']
-            
-            # Calcular análisis PEPS
-            peps_analysis = self.calculate_peps_analysis(operations)
-            
-            return {
-                'success': True,
-                'operations': operations,
-                'positions': positions,
-                'peps_analysis': peps_analysis,
-                'total_operations': len(operations),
-                'total_positions': len(positions),
-                'pdf_source': os.path.basename(pdf_path)
-            }
-            
-        except Exception as e:
-            logger.error(f"Error procesando PDF {pdf_path}: {e}")
-            return {
-                'success': False,
-                'error': str(e),
-                'operations': [],
-                'positions': [],
-                'peps_analysis': {}
-            }, '').strip()
-                                    if clean_part and clean_part != ',':
-                                        numeric_parts.append(clean_part)
-                            
-                            # Necesitamos al menos 3 valores numéricos: cantidad, valor unitario, monto total
-                            if len(numeric_parts) >= 3:
-                                quantity = self.clean_amount(numeric_parts[0])
-                                unit_value = self.clean_amount(numeric_parts[1])
-                                total_amount = self.clean_amount(numeric_parts[2])
-                                
-                                # Validar que los valores sean razonables
-                                if quantity > 0 and unit_value > 0 and total_amount > 0:
-                                    operation = {
-                                        'date': date,
-                                        'operation_type': operation_type,
-                                        'fund_name': current_fund,
-                                        'fund_type': 'Money Market' if 'FIMA' in current_fund else 'Otro',
-                                        'quantity': quantity,
-                                        'unit_value': unit_value,
-                                        'total_amount': total_amount,
-                                        'description': f"{operation_type} - {current_fund}",
-                                        'pdf_source': pdf_source
-                                    }
-                                    operations.append(operation)
-                                    logger.info(f"Operación parseada: {date} {operation_type} {quantity} cuotas a ${unit_value} = ${total_amount}")
-                                else:
-                                    logger.warning(f"Valores inválidos en línea {i}: cantidad={quantity}, valor={unit_value}, total={total_amount}")
-                            else:
-                                logger.warning(f"Insuficientes valores numéricos en línea {i}: {numeric_parts}")
-                        else:
-                            logger.warning(f"Línea con formato inesperado en línea {i}: {len(parts)} partes - {line}")
-                    
-                    except Exception as e:
-                        logger.warning(f"Error parseando operación en línea {i}: {e} - Línea: {line}")
-                        continue
-        
-        logger.info(f"Parsing completado: {len(operations)} operaciones, {len(positions)} posiciones")
-        
-        return {
-            'operations': operations,
-            'positions': positions
-        }
-    
-    def calculate_peps_analysis(self, operations: List[Dict]) -> Dict:
-        """Calcular análisis PEPS para cada fondo"""
-        funds_analysis = {}
-        
-        # Agrupar operaciones por fondo
-        funds_operations = {}
-        for op in operations:
-            fund_name = op['fund_name']
-            if fund_name not in funds_operations:
-                funds_operations[fund_name] = []
-            funds_operations[fund_name].append(op)
-        
-        # Calcular PEPS para cada fondo
-        for fund_name, fund_ops in funds_operations.items():
-            # Ordenar operaciones por fecha
-            fund_ops.sort(key=lambda x: x['date'])
-            
-            peps_calc = PEPSCalculator()
-            fund_analysis = {
-                'fund_name': fund_name,
-                'total_purchases': Decimal('0'),
-                'total_sales': Decimal('0'),
-                'total_gain_loss': Decimal('0'),
-                'operations_detail': [],
-                'current_position': {}
-            }
-            
-            for op in fund_ops:
-                if op['operation_type'] in ['SUSCRIPCION', 'COMPRA']:
-                    # Agregar compra al PEPS
-                    peps_calc.add_purchase(op['date'], op['quantity'], op['unit_value'])
-                    fund_analysis['total_purchases'] += op['total_amount']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'COMPRA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount']
-                    })
-                    
-                elif op['operation_type'] in ['RESCATE', 'VENTA']:
-                    # Calcular venta con PEPS
-                    peps_result = peps_calc.calculate_sale(
-                        op['date'], op['quantity'], op['unit_value']
-                    )
-                    
-                    fund_analysis['total_sales'] += op['total_amount']
-                    fund_analysis['total_gain_loss'] += peps_result['gain_loss']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'VENTA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount'],
-                        'cost_basis': peps_result['cost_basis'],
-                        'gain_loss': peps_result['gain_loss'],
-                        'used_lots': peps_result.get('used_lots', [])
-                    })
-            
-            # Posición actual
-            fund_analysis['current_position'] = peps_calc.get_current_position()
-            funds_analysis[fund_name] = fund_analysis
-        
-        return funds_analysis
-    
-    def _parse_date(self, date_str: str) -> str:
-        """Convertir fecha a formato ISO"""
-        try:
-            # Intentar formato DD/MM/YYYY
-            if '/' in date_str:
-                parts = date_str.split('/')
-                if len(parts) == 3:
-                    day, month, year = parts
-                    # Validar año
-                    if len(year) == 2:
-                        year = '20' + year if int(year) < 50 else '19' + year
-                    
-                    date_obj = datetime(int(year), int(month), int(day))
-                    return date_obj.strftime('%Y-%m-%d')
-        except (ValueError, IndexError):
-            pass
-        
-        return date_str
-    
-    def process_pdf(self, pdf_path: str) -> Dict:
-        """Procesar PDF completo y retornar operaciones, posiciones y análisis PEPS"""
-        try:
-            text = self.extract_text(pdf_path)
-            if not text.strip():
-                raise Exception("No se pudo extraer texto del PDF")
-            
-            # Parsear con método específico para FIMA
-            parsed_data = self.parse_fima_operations(text, os.path.basename(pdf_path))
-            operations = parsed_data['operations']
-            positions = parsed_data['positions']
-            
-            # Calcular análisis PEPS
-            peps_analysis = self.calculate_peps_analysis(operations)
-            
-            return {
-                'success': True,
-                'operations': operations,
-                'positions': positions,
-                'peps_analysis': peps_analysis,
-                'total_operations': len(operations),
-                'total_positions': len(positions),
-                'pdf_source': os.path.basename(pdf_path)
-            }
-            
-        except Exception as e:
-            logger.error(f"Error procesando PDF {pdf_path}: {e}")
-            return {
-                'success': False,
-                'error': str(e),
-                'operations': [],
-                'positions': [],
-                'peps_analysis': {}
-            }) if p.strip()]
-                        if len(parts) >= 3:
-                            # Extraer nombre del fondo (antes del primer número)
-                            fund_name_part = parts[0]
-                            quantity_str = parts[1]
-                            total_value_str = parts[2]
-
-                            # Heurística para separar nombre de fondo y cantidad si vienen juntos
-                            match = re.match(r'^(.*?)\s+([\d.,]+)
-    
-    def calculate_peps_analysis(self, operations: List[Dict]) -> Dict:
-        """Calcular análisis PEPS para cada fondo"""
-        funds_analysis = {}
-        
-        # Agrupar operaciones por fondo
-        funds_operations = {}
-        for op in operations:
-            fund_name = op['fund_name']
-            if fund_name not in funds_operations:
-                funds_operations[fund_name] = []
-            funds_operations[fund_name].append(op)
-        
-        # Calcular PEPS para cada fondo
-        for fund_name, fund_ops in funds_operations.items():
-            # Ordenar operaciones por fecha
-            fund_ops.sort(key=lambda x: x['date'])
-            
-            peps_calc = PEPSCalculator()
-            fund_analysis = {
-                'fund_name': fund_name,
-                'total_purchases': Decimal('0'),
-                'total_sales': Decimal('0'),
-                'total_gain_loss': Decimal('0'),
-                'operations_detail': [],
-                'current_position': {}
-            }
-            
-            for op in fund_ops:
-                if op['operation_type'] in ['SUSCRIPCION', 'COMPRA']:
-                    # Agregar compra al PEPS
-                    peps_calc.add_purchase(op['date'], op['quantity'], op['unit_value'])
-                    fund_analysis['total_purchases'] += op['total_amount']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'COMPRA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount']
-                    })
-                    
-                elif op['operation_type'] in ['RESCATE', 'VENTA']:
-                    # Calcular venta con PEPS
-                    peps_result = peps_calc.calculate_sale(
-                        op['date'], op['quantity'], op['unit_value']
-                    )
-                    
-                    fund_analysis['total_sales'] += op['total_amount']
-                    fund_analysis['total_gain_loss'] += peps_result['gain_loss']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'VENTA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount'],
-                        'cost_basis': peps_result['cost_basis'],
-                        'gain_loss': peps_result['gain_loss'],
-                        'used_lots': peps_result.get('used_lots', [])
-                    })
-            
-            # Posición actual
-            fund_analysis['current_position'] = peps_calc.get_current_position()
-            funds_analysis[fund_name] = fund_analysis
-        
-        return funds_analysis
-    
-    def _parse_date(self, date_str: str) -> str:
-        """Convertir fecha a formato ISO"""
-        try:
-            # Intentar formato DD/MM/YYYY
-            if '/' in date_str:
-                parts = date_str.split('/')
-                if len(parts) == 3:
-                    day, month, year = parts
-                    # Validar año
-                    if len(year) == 2:
-                        year = '20' + year if int(year) < 50 else '19' + year
-                    
-                    date_obj = datetime(int(year), int(month), int(day))
-                    return date_obj.strftime('%Y-%m-%d')
-        except (ValueError, IndexError):
-            pass
-        
-        return date_str
-    
-    def process_pdf(self, pdf_path: str) -> Dict:
-        """Procesar PDF completo y retornar operaciones, posiciones y análisis PEPS"""
-        try:
-            text = self.extract_text(pdf_path)
-            if not text.strip():
-                raise Exception("No se pudo extraer texto del PDF")
-            
-            # Parsear con método específico para FIMA
-            parsed_data = self.parse_fima_operations(text, os.path.basename(pdf_path))
-            operations = parsed_data['operations']
-            positions = parsed_data['positions']
-            
-            # Calcular análisis PEPS
-            peps_analysis = self.calculate_peps_analysis(operations)
-            
-            return {
-                'success': True,
-                'operations': operations,
-                'positions': positions,
-                'peps_analysis': peps_analysis,
-                'total_operations': len(operations),
-                'total_positions': len(positions),
-                'pdf_source': os.path.basename(pdf_path)
-            }
-            
-        except Exception as e:
-            logger.error(f"Error procesando PDF {pdf_path}: {e}")
-            return {
-                'success': False,
-                'error': str(e),
-                'operations': [],
-                'positions': [],
-                'peps_analysis': {}
-            } in line and line.count('
-    
-    def calculate_peps_analysis(self, operations: List[Dict]) -> Dict:
-        """Calcular análisis PEPS para cada fondo"""
-        funds_analysis = {}
-        
-        # Agrupar operaciones por fondo
-        funds_operations = {}
-        for op in operations:
-            fund_name = op['fund_name']
-            if fund_name not in funds_operations:
-                funds_operations[fund_name] = []
-            funds_operations[fund_name].append(op)
-        
-        # Calcular PEPS para cada fondo
-        for fund_name, fund_ops in funds_operations.items():
-            # Ordenar operaciones por fecha
-            fund_ops.sort(key=lambda x: x['date'])
-            
-            peps_calc = PEPSCalculator()
-            fund_analysis = {
-                'fund_name': fund_name,
-                'total_purchases': Decimal('0'),
-                'total_sales': Decimal('0'),
-                'total_gain_loss': Decimal('0'),
-                'operations_detail': [],
-                'current_position': {}
-            }
-            
-            for op in fund_ops:
-                if op['operation_type'] in ['SUSCRIPCION', 'COMPRA']:
-                    # Agregar compra al PEPS
-                    peps_calc.add_purchase(op['date'], op['quantity'], op['unit_value'])
-                    fund_analysis['total_purchases'] += op['total_amount']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'COMPRA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount']
-                    })
-                    
-                elif op['operation_type'] in ['RESCATE', 'VENTA']:
-                    # Calcular venta con PEPS
-                    peps_result = peps_calc.calculate_sale(
-                        op['date'], op['quantity'], op['unit_value']
-                    )
-                    
-                    fund_analysis['total_sales'] += op['total_amount']
-                    fund_analysis['total_gain_loss'] += peps_result['gain_loss']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'VENTA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount'],
-                        'cost_basis': peps_result['cost_basis'],
-                        'gain_loss': peps_result['gain_loss'],
-                        'used_lots': peps_result.get('used_lots', [])
-                    })
-            
-            # Posición actual
-            fund_analysis['current_position'] = peps_calc.get_current_position()
-            funds_analysis[fund_name] = fund_analysis
-        
-        return funds_analysis
-    
-    def _parse_date(self, date_str: str) -> str:
-        """Convertir fecha a formato ISO"""
-        try:
-            # Intentar formato DD/MM/YYYY
-            if '/' in date_str:
-                parts = date_str.split('/')
-                if len(parts) == 3:
-                    day, month, year = parts
-                    # Validar año
-                    if len(year) == 2:
-                        year = '20' + year if int(year) < 50 else '19' + year
-                    
-                    date_obj = datetime(int(year), int(month), int(day))
-                    return date_obj.strftime('%Y-%m-%d')
-        except (ValueError, IndexError):
-            pass
-        
-        return date_str
-    
-    def process_pdf(self, pdf_path: str) -> Dict:
-        """Procesar PDF completo y retornar operaciones, posiciones y análisis PEPS"""
-        try:
-            text = self.extract_text(pdf_path)
-            if not text.strip():
-                raise Exception("No se pudo extraer texto del PDF")
-            
-            # Parsear con método específico para FIMA
-            parsed_data = self.parse_fima_operations(text, os.path.basename(pdf_path))
-            operations = parsed_data['operations']
-            positions = parsed_data['positions']
-            
-            # Calcular análisis PEPS
-            peps_analysis = self.calculate_peps_analysis(operations)
-            
-            return {
-                'success': True,
-                'operations': operations,
-                'positions': positions,
-                'peps_analysis': peps_analysis,
-                'total_operations': len(operations),
-                'total_positions': len(positions),
-                'pdf_source': os.path.basename(pdf_path)
-            }
-            
-        except Exception as e:
-            logger.error(f"Error procesando PDF {pdf_path}: {e}")
-            return {
-                'success': False,
-                'error': str(e),
-                'operations': [],
-                'positions': [],
-                'peps_analysis': {}
-            }) >= 2:
-                    try:
-                        # Dividir por $ para obtener las partes
-                        parts = line.split('
-    
-    def calculate_peps_analysis(self, operations: List[Dict]) -> Dict:
-        """Calcular análisis PEPS para cada fondo"""
-        funds_analysis = {}
-        
-        # Agrupar operaciones por fondo
-        funds_operations = {}
-        for op in operations:
-            fund_name = op['fund_name']
-            if fund_name not in funds_operations:
-                funds_operations[fund_name] = []
-            funds_operations[fund_name].append(op)
-        
-        # Calcular PEPS para cada fondo
-        for fund_name, fund_ops in funds_operations.items():
-            # Ordenar operaciones por fecha
-            fund_ops.sort(key=lambda x: x['date'])
-            
-            peps_calc = PEPSCalculator()
-            fund_analysis = {
-                'fund_name': fund_name,
-                'total_purchases': Decimal('0'),
-                'total_sales': Decimal('0'),
-                'total_gain_loss': Decimal('0'),
-                'operations_detail': [],
-                'current_position': {}
-            }
-            
-            for op in fund_ops:
-                if op['operation_type'] in ['SUSCRIPCION', 'COMPRA']:
-                    # Agregar compra al PEPS
-                    peps_calc.add_purchase(op['date'], op['quantity'], op['unit_value'])
-                    fund_analysis['total_purchases'] += op['total_amount']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'COMPRA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount']
-                    })
-                    
-                elif op['operation_type'] in ['RESCATE', 'VENTA']:
-                    # Calcular venta con PEPS
-                    peps_result = peps_calc.calculate_sale(
-                        op['date'], op['quantity'], op['unit_value']
-                    )
-                    
-                    fund_analysis['total_sales'] += op['total_amount']
-                    fund_analysis['total_gain_loss'] += peps_result['gain_loss']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'VENTA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount'],
-                        'cost_basis': peps_result['cost_basis'],
-                        'gain_loss': peps_result['gain_loss'],
-                        'used_lots': peps_result.get('used_lots', [])
-                    })
-            
-            # Posición actual
-            fund_analysis['current_position'] = peps_calc.get_current_position()
-            funds_analysis[fund_name] = fund_analysis
-        
-        return funds_analysis
-    
-    def _parse_date(self, date_str: str) -> str:
-        """Convertir fecha a formato ISO"""
-        try:
-            # Intentar formato DD/MM/YYYY
-            if '/' in date_str:
-                parts = date_str.split('/')
-                if len(parts) == 3:
-                    day, month, year = parts
-                    # Validar año
-                    if len(year) == 2:
-                        year = '20' + year if int(year) < 50 else '19' + year
-                    
-                    date_obj = datetime(int(year), int(month), int(day))
-                    return date_obj.strftime('%Y-%m-%d')
-        except (ValueError, IndexError):
-            pass
-        
-        return date_str
-    
-    def process_pdf(self, pdf_path: str) -> Dict:
-        """Procesar PDF completo y retornar operaciones, posiciones y análisis PEPS"""
-        try:
-            text = self.extract_text(pdf_path)
-            if not text.strip():
-                raise Exception("No se pudo extraer texto del PDF")
-            
-            # Parsear con método específico para FIMA
-            parsed_data = self.parse_fima_operations(text, os.path.basename(pdf_path))
-            operations = parsed_data['operations']
-            positions = parsed_data['positions']
-            
-            # Calcular análisis PEPS
-            peps_analysis = self.calculate_peps_analysis(operations)
-            
-            return {
-                'success': True,
-                'operations': operations,
-                'positions': positions,
-                'peps_analysis': peps_analysis,
-                'total_operations': len(operations),
-                'total_positions': len(positions),
-                'pdf_source': os.path.basename(pdf_path)
-            }
-            
-        except Exception as e:
-            logger.error(f"Error procesando PDF {pdf_path}: {e}")
-            return {
-                'success': False,
-                'error': str(e),
-                'operations': [],
-                'positions': [],
-                'peps_analysis': {}
-            })
-                        if len(parts) >= 3:
-                            # Extraer nombre del fondo (antes del primer número)
-                            fund_name_part = parts[0].strip()
-                            # Remover números al final del nombre del fondo
-                            fund_name_match = re.match(r'^(.+?)\s+([\d.,]+)
-    
-    def calculate_peps_analysis(self, operations: List[Dict]) -> Dict:
-        """Calcular análisis PEPS para cada fondo"""
-        funds_analysis = {}
-        
-        # Agrupar operaciones por fondo
-        funds_operations = {}
-        for op in operations:
-            fund_name = op['fund_name']
-            if fund_name not in funds_operations:
-                funds_operations[fund_name] = []
-            funds_operations[fund_name].append(op)
-        
-        # Calcular PEPS para cada fondo
-        for fund_name, fund_ops in funds_operations.items():
-            # Ordenar operaciones por fecha
-            fund_ops.sort(key=lambda x: x['date'])
-            
-            peps_calc = PEPSCalculator()
-            fund_analysis = {
-                'fund_name': fund_name,
-                'total_purchases': Decimal('0'),
-                'total_sales': Decimal('0'),
-                'total_gain_loss': Decimal('0'),
-                'operations_detail': [],
-                'current_position': {}
-            }
-            
-            for op in fund_ops:
-                if op['operation_type'] in ['SUSCRIPCION', 'COMPRA']:
-                    # Agregar compra al PEPS
-                    peps_calc.add_purchase(op['date'], op['quantity'], op['unit_value'])
-                    fund_analysis['total_purchases'] += op['total_amount']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'COMPRA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount']
-                    })
-                    
-                elif op['operation_type'] in ['RESCATE', 'VENTA']:
-                    # Calcular venta con PEPS
-                    peps_result = peps_calc.calculate_sale(
-                        op['date'], op['quantity'], op['unit_value']
-                    )
-                    
-                    fund_analysis['total_sales'] += op['total_amount']
-                    fund_analysis['total_gain_loss'] += peps_result['gain_loss']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'VENTA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount'],
-                        'cost_basis': peps_result['cost_basis'],
-                        'gain_loss': peps_result['gain_loss'],
-                        'used_lots': peps_result.get('used_lots', [])
-                    })
-            
-            # Posición actual
-            fund_analysis['current_position'] = peps_calc.get_current_position()
-            funds_analysis[fund_name] = fund_analysis
-        
-        return funds_analysis
-    
-    def _parse_date(self, date_str: str) -> str:
-        """Convertir fecha a formato ISO"""
-        try:
-            # Intentar formato DD/MM/YYYY
-            if '/' in date_str:
-                parts = date_str.split('/')
-                if len(parts) == 3:
-                    day, month, year = parts
-                    # Validar año
-                    if len(year) == 2:
-                        year = '20' + year if int(year) < 50 else '19' + year
-                    
-                    date_obj = datetime(int(year), int(month), int(day))
-                    return date_obj.strftime('%Y-%m-%d')
-        except (ValueError, IndexError):
-            pass
-        
-        return date_str
-    
-    def process_pdf(self, pdf_path: str) -> Dict:
-        """Procesar PDF completo y retornar operaciones, posiciones y análisis PEPS"""
-        try:
-            text = self.extract_text(pdf_path)
-            if not text.strip():
-                raise Exception("No se pudo extraer texto del PDF")
-            
-            # Parsear con método específico para FIMA
-            parsed_data = self.parse_fima_operations(text, os.path.basename(pdf_path))
-            operations = parsed_data['operations']
-            positions = parsed_data['positions']
-            
-            # Calcular análisis PEPS
-            peps_analysis = self.calculate_peps_analysis(operations)
-            
-            return {
-                'success': True,
-                'operations': operations,
-                'positions': positions,
-                'peps_analysis': peps_analysis,
-                'total_operations': len(operations),
-                'total_positions': len(positions),
-                'pdf_source': os.path.basename(pdf_path)
-            }
-            
-        except Exception as e:
-            logger.error(f"Error procesando PDF {pdf_path}: {e}")
-            return {
-                'success': False,
-                'error': str(e),
-                'operations': [],
-                'positions': [],
-                'peps_analysis': {}
-            }, fund_name_part)
-                            if fund_name_match:
-                                fund_name = fund_name_match.group(1).strip()
-                                quantity_str = fund_name_match.group(2).strip()
-                            else:
-                                # Fallback: usar todo como nombre del fondo
-                                fund_name = fund_name_part
-                                quantity_str = '0'
-                            
-                            # Extraer valor unitario y valor total
-                            unit_value_str = parts[1].strip()
-                            total_value_str = parts[2].strip()
-                            
-                            position = {
-                                'fund_name': fund_name,
-                                'fund_type': 'Money Market' if 'FIMA' in fund_name else 'Otro',
-                                'quantity': self.clean_amount(quantity_str),
-                                'unit_value': self.clean_amount(unit_value_str),
-                                'total_value': self.clean_amount(total_value_str)
-                            }
-                            positions.append(position)
-                            logger.info(f"Posición parseada: {fund_name} - {quantity_str} cuotas")
-                    
-                    except Exception as e:
-                        logger.warning(f"Error parseando posición en línea {i}: {e} - Línea: {line}")
-                        continue
-            
-            # Parsear operaciones con lógica mejorada
-            if parsing_operations and current_fund:
-                # Verificar si la línea contiene una fecha al inicio
-                date_match = re.match(r'^(\d{2}/\d{2}/\d{4})', line)
-                if date_match:
-                    try:
-                        # Dividir la línea por espacios/tabulaciones, manteniendo los signos $
-                        parts = line.split()
-                        
-                        if len(parts) >= 6:  # Necesitamos al menos fecha, tipo, cantidad, $, valor, $, monto, fecha
-                            date = self._parse_date(parts[0])
-                            operation_type = parts[1].upper()
-                            
-                            # Encontrar las partes numéricas (buscar patrones con $)
-                            numeric_parts = []
-                            for j, part in enumerate(parts[2:], 2):  # Empezar desde el índice 2
-                                if '
-    
-    def calculate_peps_analysis(self, operations: List[Dict]) -> Dict:
-        """Calcular análisis PEPS para cada fondo"""
-        funds_analysis = {}
-        
-        # Agrupar operaciones por fondo
-        funds_operations = {}
-        for op in operations:
-            fund_name = op['fund_name']
-            if fund_name not in funds_operations:
-                funds_operations[fund_name] = []
-            funds_operations[fund_name].append(op)
-        
-        # Calcular PEPS para cada fondo
-        for fund_name, fund_ops in funds_operations.items():
-            # Ordenar operaciones por fecha
-            fund_ops.sort(key=lambda x: x['date'])
-            
-            peps_calc = PEPSCalculator()
-            fund_analysis = {
-                'fund_name': fund_name,
-                'total_purchases': Decimal('0'),
-                'total_sales': Decimal('0'),
-                'total_gain_loss': Decimal('0'),
-                'operations_detail': [],
-                'current_position': {}
-            }
-            
-            for op in fund_ops:
-                if op['operation_type'] in ['SUSCRIPCION', 'COMPRA']:
-                    # Agregar compra al PEPS
-                    peps_calc.add_purchase(op['date'], op['quantity'], op['unit_value'])
-                    fund_analysis['total_purchases'] += op['total_amount']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'COMPRA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount']
-                    })
-                    
-                elif op['operation_type'] in ['RESCATE', 'VENTA']:
-                    # Calcular venta con PEPS
-                    peps_result = peps_calc.calculate_sale(
-                        op['date'], op['quantity'], op['unit_value']
-                    )
-                    
-                    fund_analysis['total_sales'] += op['total_amount']
-                    fund_analysis['total_gain_loss'] += peps_result['gain_loss']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'VENTA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount'],
-                        'cost_basis': peps_result['cost_basis'],
-                        'gain_loss': peps_result['gain_loss'],
-                        'used_lots': peps_result.get('used_lots', [])
-                    })
-            
-            # Posición actual
-            fund_analysis['current_position'] = peps_calc.get_current_position()
-            funds_analysis[fund_name] = fund_analysis
-        
-        return funds_analysis
-    
-    def _parse_date(self, date_str: str) -> str:
-        """Convertir fecha a formato ISO"""
-        try:
-            # Intentar formato DD/MM/YYYY
-            if '/' in date_str:
-                parts = date_str.split('/')
-                if len(parts) == 3:
-                    day, month, year = parts
-                    # Validar año
-                    if len(year) == 2:
-                        year = '20' + year if int(year) < 50 else '19' + year
-                    
-                    date_obj = datetime(int(year), int(month), int(day))
-                    return date_obj.strftime('%Y-%m-%d')
-        except (ValueError, IndexError):
-            pass
-        
-        return date_str
-    
-    def process_pdf(self, pdf_path: str) -> Dict:
-        """Procesar PDF completo y retornar operaciones, posiciones y análisis PEPS"""
-        try:
-            text = self.extract_text(pdf_path)
-            if not text.strip():
-                raise Exception("No se pudo extraer texto del PDF")
-            
-            # Parsear con método específico para FIMA
-            parsed_data = self.parse_fima_operations(text, os.path.basename(pdf_path))
-            operations = parsed_data['operations']
-            positions = parsed_data['positions']
-            
-            # Calcular análisis PEPS
-            peps_analysis = self.calculate_peps_analysis(operations)
-            
-            return {
-                'success': True,
-                'operations': operations,
-                'positions': positions,
-                'peps_analysis': peps_analysis,
-                'total_operations': len(operations),
-                'total_positions': len(positions),
-                'pdf_source': os.path.basename(pdf_path)
-            }
-            
-        except Exception as e:
-            logger.error(f"Error procesando PDF {pdf_path}: {e}")
-            return {
-                'success': False,
-                'error': str(e),
-                'operations': [],
-                'positions': [],
-                'peps_analysis': {}
-            } in part or re.match(r'^[\d.,]+
-    
-    def calculate_peps_analysis(self, operations: List[Dict]) -> Dict:
-        """Calcular análisis PEPS para cada fondo"""
-        funds_analysis = {}
-        
-        # Agrupar operaciones por fondo
-        funds_operations = {}
-        for op in operations:
-            fund_name = op['fund_name']
-            if fund_name not in funds_operations:
-                funds_operations[fund_name] = []
-            funds_operations[fund_name].append(op)
-        
-        # Calcular PEPS para cada fondo
-        for fund_name, fund_ops in funds_operations.items():
-            # Ordenar operaciones por fecha
-            fund_ops.sort(key=lambda x: x['date'])
-            
-            peps_calc = PEPSCalculator()
-            fund_analysis = {
-                'fund_name': fund_name,
-                'total_purchases': Decimal('0'),
-                'total_sales': Decimal('0'),
-                'total_gain_loss': Decimal('0'),
-                'operations_detail': [],
-                'current_position': {}
-            }
-            
-            for op in fund_ops:
-                if op['operation_type'] in ['SUSCRIPCION', 'COMPRA']:
-                    # Agregar compra al PEPS
-                    peps_calc.add_purchase(op['date'], op['quantity'], op['unit_value'])
-                    fund_analysis['total_purchases'] += op['total_amount']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'COMPRA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount']
-                    })
-                    
-                elif op['operation_type'] in ['RESCATE', 'VENTA']:
-                    # Calcular venta con PEPS
-                    peps_result = peps_calc.calculate_sale(
-                        op['date'], op['quantity'], op['unit_value']
-                    )
-                    
-                    fund_analysis['total_sales'] += op['total_amount']
-                    fund_analysis['total_gain_loss'] += peps_result['gain_loss']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'VENTA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount'],
-                        'cost_basis': peps_result['cost_basis'],
-                        'gain_loss': peps_result['gain_loss'],
-                        'used_lots': peps_result.get('used_lots', [])
-                    })
-            
-            # Posición actual
-            fund_analysis['current_position'] = peps_calc.get_current_position()
-            funds_analysis[fund_name] = fund_analysis
-        
-        return funds_analysis
-    
-    def _parse_date(self, date_str: str) -> str:
-        """Convertir fecha a formato ISO"""
-        try:
-            # Intentar formato DD/MM/YYYY
-            if '/' in date_str:
-                parts = date_str.split('/')
-                if len(parts) == 3:
-                    day, month, year = parts
-                    # Validar año
-                    if len(year) == 2:
-                        year = '20' + year if int(year) < 50 else '19' + year
-                    
-                    date_obj = datetime(int(year), int(month), int(day))
-                    return date_obj.strftime('%Y-%m-%d')
-        except (ValueError, IndexError):
-            pass
-        
-        return date_str
-    
-    def process_pdf(self, pdf_path: str) -> Dict:
-        """Procesar PDF completo y retornar operaciones, posiciones y análisis PEPS"""
-        try:
-            text = self.extract_text(pdf_path)
-            if not text.strip():
-                raise Exception("No se pudo extraer texto del PDF")
-            
-            # Parsear con método específico para FIMA
-            parsed_data = self.parse_fima_operations(text, os.path.basename(pdf_path))
-            operations = parsed_data['operations']
-            positions = parsed_data['positions']
-            
-            # Calcular análisis PEPS
-            peps_analysis = self.calculate_peps_analysis(operations)
-            
-            return {
-                'success': True,
-                'operations': operations,
-                'positions': positions,
-                'peps_analysis': peps_analysis,
-                'total_operations': len(operations),
-                'total_positions': len(positions),
-                'pdf_source': os.path.basename(pdf_path)
-            }
-            
-        except Exception as e:
-            logger.error(f"Error procesando PDF {pdf_path}: {e}")
-            return {
-                'success': False,
-                'error': str(e),
-                'operations': [],
-                'positions': [],
-                'peps_analysis': {}
-            }, part):
-                                    clean_part = part.replace('
-    
-    def calculate_peps_analysis(self, operations: List[Dict]) -> Dict:
-        """Calcular análisis PEPS para cada fondo"""
-        funds_analysis = {}
-        
-        # Agrupar operaciones por fondo
-        funds_operations = {}
-        for op in operations:
-            fund_name = op['fund_name']
-            if fund_name not in funds_operations:
-                funds_operations[fund_name] = []
-            funds_operations[fund_name].append(op)
-        
-        # Calcular PEPS para cada fondo
-        for fund_name, fund_ops in funds_operations.items():
-            # Ordenar operaciones por fecha
-            fund_ops.sort(key=lambda x: x['date'])
-            
-            peps_calc = PEPSCalculator()
-            fund_analysis = {
-                'fund_name': fund_name,
-                'total_purchases': Decimal('0'),
-                'total_sales': Decimal('0'),
-                'total_gain_loss': Decimal('0'),
-                'operations_detail': [],
-                'current_position': {}
-            }
-            
-            for op in fund_ops:
-                if op['operation_type'] in ['SUSCRIPCION', 'COMPRA']:
-                    # Agregar compra al PEPS
-                    peps_calc.add_purchase(op['date'], op['quantity'], op['unit_value'])
-                    fund_analysis['total_purchases'] += op['total_amount']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'COMPRA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount']
-                    })
-                    
-                elif op['operation_type'] in ['RESCATE', 'VENTA']:
-                    # Calcular venta con PEPS
-                    peps_result = peps_calc.calculate_sale(
-                        op['date'], op['quantity'], op['unit_value']
-                    )
-                    
-                    fund_analysis['total_sales'] += op['total_amount']
-                    fund_analysis['total_gain_loss'] += peps_result['gain_loss']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'VENTA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount'],
-                        'cost_basis': peps_result['cost_basis'],
-                        'gain_loss': peps_result['gain_loss'],
-                        'used_lots': peps_result.get('used_lots', [])
-                    })
-            
-            # Posición actual
-            fund_analysis['current_position'] = peps_calc.get_current_position()
-            funds_analysis[fund_name] = fund_analysis
-        
-        return funds_analysis
-    
-    def _parse_date(self, date_str: str) -> str:
-        """Convertir fecha a formato ISO"""
-        try:
-            # Intentar formato DD/MM/YYYY
-            if '/' in date_str:
-                parts = date_str.split('/')
-                if len(parts) == 3:
-                    day, month, year = parts
-                    # Validar año
-                    if len(year) == 2:
-                        year = '20' + year if int(year) < 50 else '19' + year
-                    
-                    date_obj = datetime(int(year), int(month), int(day))
-                    return date_obj.strftime('%Y-%m-%d')
-        except (ValueError, IndexError):
-            pass
-        
-        return date_str
-    
-    def process_pdf(self, pdf_path: str) -> Dict:
-        """Procesar PDF completo y retornar operaciones, posiciones y análisis PEPS"""
-        try:
-            text = self.extract_text(pdf_path)
-            if not text.strip():
-                raise Exception("No se pudo extraer texto del PDF")
-            
-            # Parsear con método específico para FIMA
-            parsed_data = self.parse_fima_operations(text, os.path.basename(pdf_path))
-            operations = parsed_data['operations']
-            positions = parsed_data['positions']
-            
-            # Calcular análisis PEPS
-            peps_analysis = self.calculate_peps_analysis(operations)
-            
-            return {
-                'success': True,
-                'operations': operations,
-                'positions': positions,
-                'peps_analysis': peps_analysis,
-                'total_operations': len(operations),
-                'total_positions': len(positions),
-                'pdf_source': os.path.basename(pdf_path)
-            }
-            
-        except Exception as e:
-            logger.error(f"Error procesando PDF {pdf_path}: {e}")
-            return {
-                'success': False,
-                'error': str(e),
-                'operations': [],
-                'positions': [],
-                'peps_analysis': {}
-            }, '').strip()
-                                    if clean_part and clean_part != ',':
-                                        numeric_parts.append(clean_part)
-                            
-                            # Necesitamos al menos 3 valores numéricos: cantidad, valor unitario, monto total
-                            if len(numeric_parts) >= 3:
-                                quantity = self.clean_amount(numeric_parts[0])
-                                unit_value = self.clean_amount(numeric_parts[1])
-                                total_amount = self.clean_amount(numeric_parts[2])
-                                
-                                # Validar que los valores sean razonables
-                                if quantity > 0 and unit_value > 0 and total_amount > 0:
-                                    operation = {
-                                        'date': date,
-                                        'operation_type': operation_type,
-                                        'fund_name': current_fund,
-                                        'fund_type': 'Money Market' if 'FIMA' in current_fund else 'Otro',
-                                        'quantity': quantity,
-                                        'unit_value': unit_value,
-                                        'total_amount': total_amount,
-                                        'description': f"{operation_type} - {current_fund}",
-                                        'pdf_source': pdf_source
-                                    }
-                                    operations.append(operation)
-                                    logger.info(f"Operación parseada: {date} {operation_type} {quantity} cuotas a ${unit_value} = ${total_amount}")
-                                else:
-                                    logger.warning(f"Valores inválidos en línea {i}: cantidad={quantity}, valor={unit_value}, total={total_amount}")
-                            else:
-                                logger.warning(f"Insuficientes valores numéricos en línea {i}: {numeric_parts}")
-                        else:
-                            logger.warning(f"Línea con formato inesperado en línea {i}: {len(parts)} partes - {line}")
-                    
-                    except Exception as e:
-                        logger.warning(f"Error parseando operación en línea {i}: {e} - Línea: {line}")
-                        continue
-        
-        logger.info(f"Parsing completado: {len(operations)} operaciones, {len(positions)} posiciones")
-        
-        return {
-            'operations': operations,
-            'positions': positions
-        }
-    
-    def calculate_peps_analysis(self, operations: List[Dict]) -> Dict:
-        """Calcular análisis PEPS para cada fondo"""
-        funds_analysis = {}
-        
-        # Agrupar operaciones por fondo
-        funds_operations = {}
-        for op in operations:
-            fund_name = op['fund_name']
-            if fund_name not in funds_operations:
-                funds_operations[fund_name] = []
-            funds_operations[fund_name].append(op)
-        
-        # Calcular PEPS para cada fondo
-        for fund_name, fund_ops in funds_operations.items():
-            # Ordenar operaciones por fecha
-            fund_ops.sort(key=lambda x: x['date'])
-            
-            peps_calc = PEPSCalculator()
-            fund_analysis = {
-                'fund_name': fund_name,
-                'total_purchases': Decimal('0'),
-                'total_sales': Decimal('0'),
-                'total_gain_loss': Decimal('0'),
-                'operations_detail': [],
-                'current_position': {}
-            }
-            
-            for op in fund_ops:
-                if op['operation_type'] in ['SUSCRIPCION', 'COMPRA']:
-                    # Agregar compra al PEPS
-                    peps_calc.add_purchase(op['date'], op['quantity'], op['unit_value'])
-                    fund_analysis['total_purchases'] += op['total_amount']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'COMPRA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount']
-                    })
-                    
-                elif op['operation_type'] in ['RESCATE', 'VENTA']:
-                    # Calcular venta con PEPS
-                    peps_result = peps_calc.calculate_sale(
-                        op['date'], op['quantity'], op['unit_value']
-                    )
-                    
-                    fund_analysis['total_sales'] += op['total_amount']
-                    fund_analysis['total_gain_loss'] += peps_result['gain_loss']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'VENTA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount'],
-                        'cost_basis': peps_result['cost_basis'],
-                        'gain_loss': peps_result['gain_loss'],
-                        'used_lots': peps_result.get('used_lots', [])
-                    })
-            
-            # Posición actual
-            fund_analysis['current_position'] = peps_calc.get_current_position()
-            funds_analysis[fund_name] = fund_analysis
-        
-        return funds_analysis
-    
-    def _parse_date(self, date_str: str) -> str:
-        """Convertir fecha a formato ISO"""
-        try:
-            # Intentar formato DD/MM/YYYY
-            if '/' in date_str:
-                parts = date_str.split('/')
-                if len(parts) == 3:
-                    day, month, year = parts
-                    # Validar año
-                    if len(year) == 2:
-                        year = '20' + year if int(year) < 50 else '19' + year
-                    
-                    date_obj = datetime(int(year), int(month), int(day))
-                    return date_obj.strftime('%Y-%m-%d')
-        except (ValueError, IndexError):
-            pass
-        
-        return date_str
-    
-    def process_pdf(self, pdf_path: str) -> Dict:
-        """Procesar PDF completo y retornar operaciones, posiciones y análisis PEPS"""
-        try:
-            text = self.extract_text(pdf_path)
-            if not text.strip():
-                raise Exception("No se pudo extraer texto del PDF")
-            
-            # Parsear con método específico para FIMA
-            parsed_data = self.parse_fima_operations(text, os.path.basename(pdf_path))
-            operations = parsed_data['operations']
-            positions = parsed_data['positions']
-            
-            # Calcular análisis PEPS
-            peps_analysis = self.calculate_peps_analysis(operations)
-            
-            return {
-                'success': True,
-                'operations': operations,
-                'positions': positions,
-                'peps_analysis': peps_analysis,
-                'total_operations': len(operations),
-                'total_positions': len(positions),
-                'pdf_source': os.path.basename(pdf_path)
-            }
-            
-        except Exception as e:
-            logger.error(f"Error procesando PDF {pdf_path}: {e}")
-            return {
-                'success': False,
-                'error': str(e),
-                'operations': [],
-                'positions': [],
-                'peps_analysis': {}
-            }, fund_name_part)
-                            if match:
-                                fund_name = match.group(1).strip()
-                                # La cantidad ya la tenemos de la segunda parte del split
-                            else:
-                                fund_name = fund_name_part
-                            
-                            position = {
-                                'fund_name': fund_name,
-                                'fund_type': 'Money Market' if 'FIMA' in fund_name else 'Otro',
-                                'quantity': self.clean_amount(quantity_str),
-                                'unit_value': self.clean_amount(total_value_str) / self.clean_amount(quantity_str) if self.clean_amount(quantity_str) != 0 else Decimal(0),
-                                'total_value': self.clean_amount(total_value_str)
-                            }
-                            positions.append(position)
-                            logger.info(f"Posición parseada: {fund_name} - {quantity_str} cuotas")
-                    
-                    except Exception as e:
-                        logger.warning(f"Error parseando posición en línea {i}: {e} - Línea: {line}")
-                        continue
-            
-            # Parsear operaciones con lógica mejorada
-            if parsing_operations and current_fund:
-                # Verificar si la línea contiene una fecha al inicio
-                date_match = re.match(r'^(\d{2}/\d{2}/\d{4})', line)
-                if date_match:
-                    try:
-                        parts = line.split()
-                        
-                        if len(parts) >= 4:
-                            date = self._parse_date(parts[0])
-                            operation_type = parts[1].upper()
-                            
-                            # Limpiar y unir las partes restantes para buscar los números
-                            remaining_line = ' '.join(parts[2:])
-                            
-                            # Extraer todos los números de la línea
-                            numbers = re.findall(r'[\d.,]+', remaining_line)
-                            
-                            if len(numbers) >= 3:
-                                quantity = self.clean_amount(numbers[0])
-                                unit_value = self.clean_amount(numbers[1])
-                                total_amount = self.clean_amount(numbers[2])
-                                
-                                if quantity > 0 and unit_value > 0 and total_amount > 0:
-                                    operation = {
-                                        'date': date,
-                                        'operation_type': operation_type,
-                                        'fund_name': current_fund,
-                                        'fund_type': 'Money Market' if 'FIMA' in current_fund else 'Otro',
-                                        'quantity': quantity,
-                                        'unit_value': unit_value,
-                                        'total_amount': total_amount,
-                                        'description': f"{operation_type} - {current_fund}",
-                                        'pdf_source': pdf_source
-                                    }
-                                    operations.append(operation)
-                                    logger.info(f"Operación parseada: {date} {operation_type} {quantity} cuotas a ${unit_value} = ${total_amount}")
-                                else:
-                                    logger.warning(f"Valores inválidos en línea {i}: cantidad={quantity}, valor={unit_value}, total={total_amount}")
-                            else:
-                                logger.warning(f"Insuficientes valores numéricos en línea {i}: {numbers}")
-                        else:
-                            logger.warning(f"Línea con formato inesperado en línea {i}: {len(parts)} partes - {line}")
-                    
-                    except Exception as e:
-                        logger.warning(f"Error parseando operación en línea {i}: {e} - Línea: {line}")
-                        continue
-        
-        logger.info(f"Parsing completado: {len(operations)} operaciones, {len(positions)} posiciones")
-        
-        return {
-            'operations': operations,
-            'positions': positions
-        }
-    
-    def calculate_peps_analysis(self, operations: List[Dict]) -> Dict:
-        """Calcular análisis PEPS para cada fondo"""
-        funds_analysis = {}
-        
-        # Agrupar operaciones por fondo
-        funds_operations = {}
-        for op in operations:
-            fund_name = op['fund_name']
-            if fund_name not in funds_operations:
-                funds_operations[fund_name] = []
-            funds_operations[fund_name].append(op)
-        
-        # Calcular PEPS para cada fondo
-        for fund_name, fund_ops in funds_operations.items():
-            # Ordenar operaciones por fecha
-            fund_ops.sort(key=lambda x: x['date'])
-            
-            peps_calc = PEPSCalculator()
-            fund_analysis = {
-                'fund_name': fund_name,
-                'total_purchases': Decimal('0'),
-                'total_sales': Decimal('0'),
-                'total_gain_loss': Decimal('0'),
-                'operations_detail': [],
-                'current_position': {}
-            }
-            
-            for op in fund_ops:
-                if op['operation_type'] in ['SUSCRIPCION', 'COMPRA']:
-                    # Agregar compra al PEPS
-                    peps_calc.add_purchase(op['date'], op['quantity'], op['unit_value'])
-                    fund_analysis['total_purchases'] += op['total_amount']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'COMPRA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount']
-                    })
-                    
-                elif op['operation_type'] in ['RESCATE', 'VENTA']:
-                    # Calcular venta con PEPS
-                    peps_result = peps_calc.calculate_sale(
-                        op['date'], op['quantity'], op['unit_value']
-                    )
-                    
-                    fund_analysis['total_sales'] += op['total_amount']
-                    fund_analysis['total_gain_loss'] += peps_result['gain_loss']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'VENTA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount'],
-                        'cost_basis': peps_result['cost_basis'],
-                        'gain_loss': peps_result['gain_loss'],
-                        'used_lots': peps_result.get('used_lots', [])
-                    })
-            
-            # Posición actual
-            fund_analysis['current_position'] = peps_calc.get_current_position()
-            funds_analysis[fund_name] = fund_analysis
-        
-        return funds_analysis
-    
-    def _parse_date(self, date_str: str) -> str:
-        """Convertir fecha a formato ISO"""
-        try:
-            # Intentar formato DD/MM/YYYY
-            if '/' in date_str:
-                parts = date_str.split('/')
-                if len(parts) == 3:
-                    day, month, year = parts
-                    # Validar año
-                    if len(year) == 2:
-                        year = '20' + year if int(year) < 50 else '19' + year
-                    
-                    date_obj = datetime(int(year), int(month), int(day))
-                    return date_obj.strftime('%Y-%m-%d')
-        except (ValueError, IndexError):
-            pass
-        
-        return date_str
-    
-    def process_pdf(self, pdf_path: str) -> Dict:
-        """Procesar PDF completo y retornar operaciones, posiciones y análisis PEPS"""
-        try:
-            text = self.extract_text(pdf_path)
-            if not text.strip():
-                raise Exception("No se pudo extraer texto del PDF")
-            
-            # Parsear con método específico para FIMA
-            parsed_data = self.parse_fima_operations(text, os.path.basename(pdf_path))
-            operations = parsed_data['operations']
-            positions = parsed_data['positions']
-            
-            # Calcular análisis PEPS
-            peps_analysis = self.calculate_peps_analysis(operations)
-            
-            return {
-                'success': True,
-                'operations': operations,
-                'positions': positions,
-                'peps_analysis': peps_analysis,
-                'total_operations': len(operations),
-                'total_positions': len(positions),
-                'pdf_source': os.path.basename(pdf_path)
-            }
-            
-        except Exception as e:
-            logger.error(f"Error procesando PDF {pdf_path}: {e}")
-            return {
-                'success': False,
-                'error': str(e),
-                'operations': [],
-                'positions': [],
-                'peps_analysis': {}
-            } in line and line.count('
-    
-    def calculate_peps_analysis(self, operations: List[Dict]) -> Dict:
-        """Calcular análisis PEPS para cada fondo"""
-        funds_analysis = {}
-        
-        # Agrupar operaciones por fondo
-        funds_operations = {}
-        for op in operations:
-            fund_name = op['fund_name']
-            if fund_name not in funds_operations:
-                funds_operations[fund_name] = []
-            funds_operations[fund_name].append(op)
-        
-        # Calcular PEPS para cada fondo
-        for fund_name, fund_ops in funds_operations.items():
-            # Ordenar operaciones por fecha
-            fund_ops.sort(key=lambda x: x['date'])
-            
-            peps_calc = PEPSCalculator()
-            fund_analysis = {
-                'fund_name': fund_name,
-                'total_purchases': Decimal('0'),
-                'total_sales': Decimal('0'),
-                'total_gain_loss': Decimal('0'),
-                'operations_detail': [],
-                'current_position': {}
-            }
-            
-            for op in fund_ops:
-                if op['operation_type'] in ['SUSCRIPCION', 'COMPRA']:
-                    # Agregar compra al PEPS
-                    peps_calc.add_purchase(op['date'], op['quantity'], op['unit_value'])
-                    fund_analysis['total_purchases'] += op['total_amount']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'COMPRA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount']
-                    })
-                    
-                elif op['operation_type'] in ['RESCATE', 'VENTA']:
-                    # Calcular venta con PEPS
-                    peps_result = peps_calc.calculate_sale(
-                        op['date'], op['quantity'], op['unit_value']
-                    )
-                    
-                    fund_analysis['total_sales'] += op['total_amount']
-                    fund_analysis['total_gain_loss'] += peps_result['gain_loss']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'VENTA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount'],
-                        'cost_basis': peps_result['cost_basis'],
-                        'gain_loss': peps_result['gain_loss'],
-                        'used_lots': peps_result.get('used_lots', [])
-                    })
-            
-            # Posición actual
-            fund_analysis['current_position'] = peps_calc.get_current_position()
-            funds_analysis[fund_name] = fund_analysis
-        
-        return funds_analysis
-    
-    def _parse_date(self, date_str: str) -> str:
-        """Convertir fecha a formato ISO"""
-        try:
-            # Intentar formato DD/MM/YYYY
-            if '/' in date_str:
-                parts = date_str.split('/')
-                if len(parts) == 3:
-                    day, month, year = parts
-                    # Validar año
-                    if len(year) == 2:
-                        year = '20' + year if int(year) < 50 else '19' + year
-                    
-                    date_obj = datetime(int(year), int(month), int(day))
-                    return date_obj.strftime('%Y-%m-%d')
-        except (ValueError, IndexError):
-            pass
-        
-        return date_str
-    
-    def process_pdf(self, pdf_path: str) -> Dict:
-        """Procesar PDF completo y retornar operaciones, posiciones y análisis PEPS"""
-        try:
-            text = self.extract_text(pdf_path)
-            if not text.strip():
-                raise Exception("No se pudo extraer texto del PDF")
-            
-            # Parsear con método específico para FIMA
-            parsed_data = self.parse_fima_operations(text, os.path.basename(pdf_path))
-            operations = parsed_data['operations']
-            positions = parsed_data['positions']
-            
-            # Calcular análisis PEPS
-            peps_analysis = self.calculate_peps_analysis(operations)
-            
-            return {
-                'success': True,
-                'operations': operations,
-                'positions': positions,
-                'peps_analysis': peps_analysis,
-                'total_operations': len(operations),
-                'total_positions': len(positions),
-                'pdf_source': os.path.basename(pdf_path)
-            }
-            
-        except Exception as e:
-            logger.error(f"Error procesando PDF {pdf_path}: {e}")
-            return {
-                'success': False,
-                'error': str(e),
-                'operations': [],
-                'positions': [],
-                'peps_analysis': {}
-            }) >= 2:
-                    try:
-                        # Dividir por $ para obtener las partes
-                        parts = line.split('
-    
-    def calculate_peps_analysis(self, operations: List[Dict]) -> Dict:
-        """Calcular análisis PEPS para cada fondo"""
-        funds_analysis = {}
-        
-        # Agrupar operaciones por fondo
-        funds_operations = {}
-        for op in operations:
-            fund_name = op['fund_name']
-            if fund_name not in funds_operations:
-                funds_operations[fund_name] = []
-            funds_operations[fund_name].append(op)
-        
-        # Calcular PEPS para cada fondo
-        for fund_name, fund_ops in funds_operations.items():
-            # Ordenar operaciones por fecha
-            fund_ops.sort(key=lambda x: x['date'])
-            
-            peps_calc = PEPSCalculator()
-            fund_analysis = {
-                'fund_name': fund_name,
-                'total_purchases': Decimal('0'),
-                'total_sales': Decimal('0'),
-                'total_gain_loss': Decimal('0'),
-                'operations_detail': [],
-                'current_position': {}
-            }
-            
-            for op in fund_ops:
-                if op['operation_type'] in ['SUSCRIPCION', 'COMPRA']:
-                    # Agregar compra al PEPS
-                    peps_calc.add_purchase(op['date'], op['quantity'], op['unit_value'])
-                    fund_analysis['total_purchases'] += op['total_amount']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'COMPRA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount']
-                    })
-                    
-                elif op['operation_type'] in ['RESCATE', 'VENTA']:
-                    # Calcular venta con PEPS
-                    peps_result = peps_calc.calculate_sale(
-                        op['date'], op['quantity'], op['unit_value']
-                    )
-                    
-                    fund_analysis['total_sales'] += op['total_amount']
-                    fund_analysis['total_gain_loss'] += peps_result['gain_loss']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'VENTA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount'],
-                        'cost_basis': peps_result['cost_basis'],
-                        'gain_loss': peps_result['gain_loss'],
-                        'used_lots': peps_result.get('used_lots', [])
-                    })
-            
-            # Posición actual
-            fund_analysis['current_position'] = peps_calc.get_current_position()
-            funds_analysis[fund_name] = fund_analysis
-        
-        return funds_analysis
-    
-    def _parse_date(self, date_str: str) -> str:
-        """Convertir fecha a formato ISO"""
-        try:
-            # Intentar formato DD/MM/YYYY
-            if '/' in date_str:
-                parts = date_str.split('/')
-                if len(parts) == 3:
-                    day, month, year = parts
-                    # Validar año
-                    if len(year) == 2:
-                        year = '20' + year if int(year) < 50 else '19' + year
-                    
-                    date_obj = datetime(int(year), int(month), int(day))
-                    return date_obj.strftime('%Y-%m-%d')
-        except (ValueError, IndexError):
-            pass
-        
-        return date_str
-    
-    def process_pdf(self, pdf_path: str) -> Dict:
-        """Procesar PDF completo y retornar operaciones, posiciones y análisis PEPS"""
-        try:
-            text = self.extract_text(pdf_path)
-            if not text.strip():
-                raise Exception("No se pudo extraer texto del PDF")
-            
-            # Parsear con método específico para FIMA
-            parsed_data = self.parse_fima_operations(text, os.path.basename(pdf_path))
-            operations = parsed_data['operations']
-            positions = parsed_data['positions']
-            
-            # Calcular análisis PEPS
-            peps_analysis = self.calculate_peps_analysis(operations)
-            
-            return {
-                'success': True,
-                'operations': operations,
-                'positions': positions,
-                'peps_analysis': peps_analysis,
-                'total_operations': len(operations),
-                'total_positions': len(positions),
-                'pdf_source': os.path.basename(pdf_path)
-            }
-            
-        except Exception as e:
-            logger.error(f"Error procesando PDF {pdf_path}: {e}")
-            return {
-                'success': False,
-                'error': str(e),
-                'operations': [],
-                'positions': [],
-                'peps_analysis': {}
-            })
-                        if len(parts) >= 3:
-                            # Extraer nombre del fondo (antes del primer número)
-                            fund_name_part = parts[0].strip()
-                            # Remover números al final del nombre del fondo
-                            fund_name_match = re.match(r'^(.+?)\s+([\d.,]+)
-    
-    def calculate_peps_analysis(self, operations: List[Dict]) -> Dict:
-        """Calcular análisis PEPS para cada fondo"""
-        funds_analysis = {}
-        
-        # Agrupar operaciones por fondo
-        funds_operations = {}
-        for op in operations:
-            fund_name = op['fund_name']
-            if fund_name not in funds_operations:
-                funds_operations[fund_name] = []
-            funds_operations[fund_name].append(op)
-        
-        # Calcular PEPS para cada fondo
-        for fund_name, fund_ops in funds_operations.items():
-            # Ordenar operaciones por fecha
-            fund_ops.sort(key=lambda x: x['date'])
-            
-            peps_calc = PEPSCalculator()
-            fund_analysis = {
-                'fund_name': fund_name,
-                'total_purchases': Decimal('0'),
-                'total_sales': Decimal('0'),
-                'total_gain_loss': Decimal('0'),
-                'operations_detail': [],
-                'current_position': {}
-            }
-            
-            for op in fund_ops:
-                if op['operation_type'] in ['SUSCRIPCION', 'COMPRA']:
-                    # Agregar compra al PEPS
-                    peps_calc.add_purchase(op['date'], op['quantity'], op['unit_value'])
-                    fund_analysis['total_purchases'] += op['total_amount']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'COMPRA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount']
-                    })
-                    
-                elif op['operation_type'] in ['RESCATE', 'VENTA']:
-                    # Calcular venta con PEPS
-                    peps_result = peps_calc.calculate_sale(
-                        op['date'], op['quantity'], op['unit_value']
-                    )
-                    
-                    fund_analysis['total_sales'] += op['total_amount']
-                    fund_analysis['total_gain_loss'] += peps_result['gain_loss']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'VENTA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount'],
-                        'cost_basis': peps_result['cost_basis'],
-                        'gain_loss': peps_result['gain_loss'],
-                        'used_lots': peps_result.get('used_lots', [])
-                    })
-            
-            # Posición actual
-            fund_analysis['current_position'] = peps_calc.get_current_position()
-            funds_analysis[fund_name] = fund_analysis
-        
-        return funds_analysis
-    
-    def _parse_date(self, date_str: str) -> str:
-        """Convertir fecha a formato ISO"""
-        try:
-            # Intentar formato DD/MM/YYYY
-            if '/' in date_str:
-                parts = date_str.split('/')
-                if len(parts) == 3:
-                    day, month, year = parts
-                    # Validar año
-                    if len(year) == 2:
-                        year = '20' + year if int(year) < 50 else '19' + year
-                    
-                    date_obj = datetime(int(year), int(month), int(day))
-                    return date_obj.strftime('%Y-%m-%d')
-        except (ValueError, IndexError):
-            pass
-        
-        return date_str
-    
-    def process_pdf(self, pdf_path: str) -> Dict:
-        """Procesar PDF completo y retornar operaciones, posiciones y análisis PEPS"""
-        try:
-            text = self.extract_text(pdf_path)
-            if not text.strip():
-                raise Exception("No se pudo extraer texto del PDF")
-            
-            # Parsear con método específico para FIMA
-            parsed_data = self.parse_fima_operations(text, os.path.basename(pdf_path))
-            operations = parsed_data['operations']
-            positions = parsed_data['positions']
-            
-            # Calcular análisis PEPS
-            peps_analysis = self.calculate_peps_analysis(operations)
-            
-            return {
-                'success': True,
-                'operations': operations,
-                'positions': positions,
-                'peps_analysis': peps_analysis,
-                'total_operations': len(operations),
-                'total_positions': len(positions),
-                'pdf_source': os.path.basename(pdf_path)
-            }
-            
-        except Exception as e:
-            logger.error(f"Error procesando PDF {pdf_path}: {e}")
-            return {
-                'success': False,
-                'error': str(e),
-                'operations': [],
-                'positions': [],
-                'peps_analysis': {}
-            }, fund_name_part)
-                            if fund_name_match:
-                                fund_name = fund_name_match.group(1).strip()
-                                quantity_str = fund_name_match.group(2).strip()
-                            else:
-                                # Fallback: usar todo como nombre del fondo
-                                fund_name = fund_name_part
-                                quantity_str = '0'
-                            
-                            # Extraer valor unitario y valor total
-                            unit_value_str = parts[1].strip()
-                            total_value_str = parts[2].strip()
-                            
-                            position = {
-                                'fund_name': fund_name,
-                                'fund_type': 'Money Market' if 'FIMA' in fund_name else 'Otro',
-                                'quantity': self.clean_amount(quantity_str),
-                                'unit_value': self.clean_amount(unit_value_str),
-                                'total_value': self.clean_amount(total_value_str)
-                            }
-                            positions.append(position)
-                            logger.info(f"Posición parseada: {fund_name} - {quantity_str} cuotas")
-                    
-                    except Exception as e:
-                        logger.warning(f"Error parseando posición en línea {i}: {e} - Línea: {line}")
-                        continue
-            
-            # Parsear operaciones con lógica mejorada
-            if parsing_operations and current_fund:
-                # Verificar si la línea contiene una fecha al inicio
-                date_match = re.match(r'^(\d{2}/\d{2}/\d{4})', line)
-                if date_match:
-                    try:
-                        # Dividir la línea por espacios/tabulaciones, manteniendo los signos $
-                        parts = line.split()
-                        
-                        if len(parts) >= 6:  # Necesitamos al menos fecha, tipo, cantidad, $, valor, $, monto, fecha
-                            date = self._parse_date(parts[0])
-                            operation_type = parts[1].upper()
-                            
-                            # Encontrar las partes numéricas (buscar patrones con $)
-                            numeric_parts = []
-                            for j, part in enumerate(parts[2:], 2):  # Empezar desde el índice 2
-                                if '
-    
-    def calculate_peps_analysis(self, operations: List[Dict]) -> Dict:
-        """Calcular análisis PEPS para cada fondo"""
-        funds_analysis = {}
-        
-        # Agrupar operaciones por fondo
-        funds_operations = {}
-        for op in operations:
-            fund_name = op['fund_name']
-            if fund_name not in funds_operations:
-                funds_operations[fund_name] = []
-            funds_operations[fund_name].append(op)
-        
-        # Calcular PEPS para cada fondo
-        for fund_name, fund_ops in funds_operations.items():
-            # Ordenar operaciones por fecha
-            fund_ops.sort(key=lambda x: x['date'])
-            
-            peps_calc = PEPSCalculator()
-            fund_analysis = {
-                'fund_name': fund_name,
-                'total_purchases': Decimal('0'),
-                'total_sales': Decimal('0'),
-                'total_gain_loss': Decimal('0'),
-                'operations_detail': [],
-                'current_position': {}
-            }
-            
-            for op in fund_ops:
-                if op['operation_type'] in ['SUSCRIPCION', 'COMPRA']:
-                    # Agregar compra al PEPS
-                    peps_calc.add_purchase(op['date'], op['quantity'], op['unit_value'])
-                    fund_analysis['total_purchases'] += op['total_amount']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'COMPRA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount']
-                    })
-                    
-                elif op['operation_type'] in ['RESCATE', 'VENTA']:
-                    # Calcular venta con PEPS
-                    peps_result = peps_calc.calculate_sale(
-                        op['date'], op['quantity'], op['unit_value']
-                    )
-                    
-                    fund_analysis['total_sales'] += op['total_amount']
-                    fund_analysis['total_gain_loss'] += peps_result['gain_loss']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'VENTA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount'],
-                        'cost_basis': peps_result['cost_basis'],
-                        'gain_loss': peps_result['gain_loss'],
-                        'used_lots': peps_result.get('used_lots', [])
-                    })
-            
-            # Posición actual
-            fund_analysis['current_position'] = peps_calc.get_current_position()
-            funds_analysis[fund_name] = fund_analysis
-        
-        return funds_analysis
-    
-    def _parse_date(self, date_str: str) -> str:
-        """Convertir fecha a formato ISO"""
-        try:
-            # Intentar formato DD/MM/YYYY
-            if '/' in date_str:
-                parts = date_str.split('/')
-                if len(parts) == 3:
-                    day, month, year = parts
-                    # Validar año
-                    if len(year) == 2:
-                        year = '20' + year if int(year) < 50 else '19' + year
-                    
-                    date_obj = datetime(int(year), int(month), int(day))
-                    return date_obj.strftime('%Y-%m-%d')
-        except (ValueError, IndexError):
-            pass
-        
-        return date_str
-    
-    def process_pdf(self, pdf_path: str) -> Dict:
-        """Procesar PDF completo y retornar operaciones, posiciones y análisis PEPS"""
-        try:
-            text = self.extract_text(pdf_path)
-            if not text.strip():
-                raise Exception("No se pudo extraer texto del PDF")
-            
-            # Parsear con método específico para FIMA
-            parsed_data = self.parse_fima_operations(text, os.path.basename(pdf_path))
-            operations = parsed_data['operations']
-            positions = parsed_data['positions']
-            
-            # Calcular análisis PEPS
-            peps_analysis = self.calculate_peps_analysis(operations)
-            
-            return {
-                'success': True,
-                'operations': operations,
-                'positions': positions,
-                'peps_analysis': peps_analysis,
-                'total_operations': len(operations),
-                'total_positions': len(positions),
-                'pdf_source': os.path.basename(pdf_path)
-            }
-            
-        except Exception as e:
-            logger.error(f"Error procesando PDF {pdf_path}: {e}")
-            return {
-                'success': False,
-                'error': str(e),
-                'operations': [],
-                'positions': [],
-                'peps_analysis': {}
-            } in part or re.match(r'^[\d.,]+
-    
-    def calculate_peps_analysis(self, operations: List[Dict]) -> Dict:
-        """Calcular análisis PEPS para cada fondo"""
-        funds_analysis = {}
-        
-        # Agrupar operaciones por fondo
-        funds_operations = {}
-        for op in operations:
-            fund_name = op['fund_name']
-            if fund_name not in funds_operations:
-                funds_operations[fund_name] = []
-            funds_operations[fund_name].append(op)
-        
-        # Calcular PEPS para cada fondo
-        for fund_name, fund_ops in funds_operations.items():
-            # Ordenar operaciones por fecha
-            fund_ops.sort(key=lambda x: x['date'])
-            
-            peps_calc = PEPSCalculator()
-            fund_analysis = {
-                'fund_name': fund_name,
-                'total_purchases': Decimal('0'),
-                'total_sales': Decimal('0'),
-                'total_gain_loss': Decimal('0'),
-                'operations_detail': [],
-                'current_position': {}
-            }
-            
-            for op in fund_ops:
-                if op['operation_type'] in ['SUSCRIPCION', 'COMPRA']:
-                    # Agregar compra al PEPS
-                    peps_calc.add_purchase(op['date'], op['quantity'], op['unit_value'])
-                    fund_analysis['total_purchases'] += op['total_amount']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'COMPRA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount']
-                    })
-                    
-                elif op['operation_type'] in ['RESCATE', 'VENTA']:
-                    # Calcular venta con PEPS
-                    peps_result = peps_calc.calculate_sale(
-                        op['date'], op['quantity'], op['unit_value']
-                    )
-                    
-                    fund_analysis['total_sales'] += op['total_amount']
-                    fund_analysis['total_gain_loss'] += peps_result['gain_loss']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'VENTA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount'],
-                        'cost_basis': peps_result['cost_basis'],
-                        'gain_loss': peps_result['gain_loss'],
-                        'used_lots': peps_result.get('used_lots', [])
-                    })
-            
-            # Posición actual
-            fund_analysis['current_position'] = peps_calc.get_current_position()
-            funds_analysis[fund_name] = fund_analysis
-        
-        return funds_analysis
-    
-    def _parse_date(self, date_str: str) -> str:
-        """Convertir fecha a formato ISO"""
-        try:
-            # Intentar formato DD/MM/YYYY
-            if '/' in date_str:
-                parts = date_str.split('/')
-                if len(parts) == 3:
-                    day, month, year = parts
-                    # Validar año
-                    if len(year) == 2:
-                        year = '20' + year if int(year) < 50 else '19' + year
-                    
-                    date_obj = datetime(int(year), int(month), int(day))
-                    return date_obj.strftime('%Y-%m-%d')
-        except (ValueError, IndexError):
-            pass
-        
-        return date_str
-    
-    def process_pdf(self, pdf_path: str) -> Dict:
-        """Procesar PDF completo y retornar operaciones, posiciones y análisis PEPS"""
-        try:
-            text = self.extract_text(pdf_path)
-            if not text.strip():
-                raise Exception("No se pudo extraer texto del PDF")
-            
-            # Parsear con método específico para FIMA
-            parsed_data = self.parse_fima_operations(text, os.path.basename(pdf_path))
-            operations = parsed_data['operations']
-            positions = parsed_data['positions']
-            
-            # Calcular análisis PEPS
-            peps_analysis = self.calculate_peps_analysis(operations)
-            
-            return {
-                'success': True,
-                'operations': operations,
-                'positions': positions,
-                'peps_analysis': peps_analysis,
-                'total_operations': len(operations),
-                'total_positions': len(positions),
-                'pdf_source': os.path.basename(pdf_path)
-            }
-            
-        except Exception as e:
-            logger.error(f"Error procesando PDF {pdf_path}: {e}")
-            return {
-                'success': False,
-                'error': str(e),
-                'operations': [],
-                'positions': [],
-                'peps_analysis': {}
-            }, part):
-                                    clean_part = part.replace('
-    
-    def calculate_peps_analysis(self, operations: List[Dict]) -> Dict:
-        """Calcular análisis PEPS para cada fondo"""
-        funds_analysis = {}
-        
-        # Agrupar operaciones por fondo
-        funds_operations = {}
-        for op in operations:
-            fund_name = op['fund_name']
-            if fund_name not in funds_operations:
-                funds_operations[fund_name] = []
-            funds_operations[fund_name].append(op)
-        
-        # Calcular PEPS para cada fondo
-        for fund_name, fund_ops in funds_operations.items():
-            # Ordenar operaciones por fecha
-            fund_ops.sort(key=lambda x: x['date'])
-            
-            peps_calc = PEPSCalculator()
-            fund_analysis = {
-                'fund_name': fund_name,
-                'total_purchases': Decimal('0'),
-                'total_sales': Decimal('0'),
-                'total_gain_loss': Decimal('0'),
-                'operations_detail': [],
-                'current_position': {}
-            }
-            
-            for op in fund_ops:
-                if op['operation_type'] in ['SUSCRIPCION', 'COMPRA']:
-                    # Agregar compra al PEPS
-                    peps_calc.add_purchase(op['date'], op['quantity'], op['unit_value'])
-                    fund_analysis['total_purchases'] += op['total_amount']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'COMPRA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount']
-                    })
-                    
-                elif op['operation_type'] in ['RESCATE', 'VENTA']:
-                    # Calcular venta con PEPS
-                    peps_result = peps_calc.calculate_sale(
-                        op['date'], op['quantity'], op['unit_value']
-                    )
-                    
-                    fund_analysis['total_sales'] += op['total_amount']
-                    fund_analysis['total_gain_loss'] += peps_result['gain_loss']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'VENTA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount'],
-                        'cost_basis': peps_result['cost_basis'],
-                        'gain_loss': peps_result['gain_loss'],
-                        'used_lots': peps_result.get('used_lots', [])
-                    })
-            
-            # Posición actual
-            fund_analysis['current_position'] = peps_calc.get_current_position()
-            funds_analysis[fund_name] = fund_analysis
-        
-        return funds_analysis
-    
-    def _parse_date(self, date_str: str) -> str:
-        """Convertir fecha a formato ISO"""
-        try:
-            # Intentar formato DD/MM/YYYY
-            if '/' in date_str:
-                parts = date_str.split('/')
-                if len(parts) == 3:
-                    day, month, year = parts
-                    # Validar año
-                    if len(year) == 2:
-                        year = '20' + year if int(year) < 50 else '19' + year
-                    
-                    date_obj = datetime(int(year), int(month), int(day))
-                    return date_obj.strftime('%Y-%m-%d')
-        except (ValueError, IndexError):
-            pass
-        
-        return date_str
-    
-    def process_pdf(self, pdf_path: str) -> Dict:
-        """Procesar PDF completo y retornar operaciones, posiciones y análisis PEPS"""
-        try:
-            text = self.extract_text(pdf_path)
-            if not text.strip():
-                raise Exception("No se pudo extraer texto del PDF")
-            
-            # Parsear con método específico para FIMA
-            parsed_data = self.parse_fima_operations(text, os.path.basename(pdf_path))
-            operations = parsed_data['operations']
-            positions = parsed_data['positions']
-            
-            # Calcular análisis PEPS
-            peps_analysis = self.calculate_peps_analysis(operations)
-            
-            return {
-                'success': True,
-                'operations': operations,
-                'positions': positions,
-                'peps_analysis': peps_analysis,
-                'total_operations': len(operations),
-                'total_positions': len(positions),
-                'pdf_source': os.path.basename(pdf_path)
-            }
-            
-        except Exception as e:
-            logger.error(f"Error procesando PDF {pdf_path}: {e}")
-            return {
-                'success': False,
-                'error': str(e),
-                'operations': [],
-                'positions': [],
-                'peps_analysis': {}
-            }, '').strip()
-                                    if clean_part and clean_part != ',':
-                                        numeric_parts.append(clean_part)
-                            
-                            # Necesitamos al menos 3 valores numéricos: cantidad, valor unitario, monto total
-                            if len(numeric_parts) >= 3:
-                                quantity = self.clean_amount(numeric_parts[0])
-                                unit_value = self.clean_amount(numeric_parts[1])
-                                total_amount = self.clean_amount(numeric_parts[2])
-                                
-                                # Validar que los valores sean razonables
-                                if quantity > 0 and unit_value > 0 and total_amount > 0:
-                                    operation = {
-                                        'date': date,
-                                        'operation_type': operation_type,
-                                        'fund_name': current_fund,
-                                        'fund_type': 'Money Market' if 'FIMA' in current_fund else 'Otro',
-                                        'quantity': quantity,
-                                        'unit_value': unit_value,
-                                        'total_amount': total_amount,
-                                        'description': f"{operation_type} - {current_fund}",
-                                        'pdf_source': pdf_source
-                                    }
-                                    operations.append(operation)
-                                    logger.info(f"Operación parseada: {date} {operation_type} {quantity} cuotas a ${unit_value} = ${total_amount}")
-                                else:
-                                    logger.warning(f"Valores inválidos en línea {i}: cantidad={quantity}, valor={unit_value}, total={total_amount}")
-                            else:
-                                logger.warning(f"Insuficientes valores numéricos en línea {i}: {numeric_parts}")
-                        else:
-                            logger.warning(f"Línea con formato inesperado en línea {i}: {len(parts)} partes - {line}")
-                    
-                    except Exception as e:
-                        logger.warning(f"Error parseando operación en línea {i}: {e} - Línea: {line}")
-                        continue
-        
-        logger.info(f"Parsing completado: {len(operations)} operaciones, {len(positions)} posiciones")
-        
-        return {
-            'operations': operations,
-            'positions': positions
-        }
-    
-    def calculate_peps_analysis(self, operations: List[Dict]) -> Dict:
-        """Calcular análisis PEPS para cada fondo"""
-        funds_analysis = {}
-        
-        # Agrupar operaciones por fondo
-        funds_operations = {}
-        for op in operations:
-            fund_name = op['fund_name']
-            if fund_name not in funds_operations:
-                funds_operations[fund_name] = []
-            funds_operations[fund_name].append(op)
-        
-        # Calcular PEPS para cada fondo
-        for fund_name, fund_ops in funds_operations.items():
-            # Ordenar operaciones por fecha
-            fund_ops.sort(key=lambda x: x['date'])
-            
-            peps_calc = PEPSCalculator()
-            fund_analysis = {
-                'fund_name': fund_name,
-                'total_purchases': Decimal('0'),
-                'total_sales': Decimal('0'),
-                'total_gain_loss': Decimal('0'),
-                'operations_detail': [],
-                'current_position': {}
-            }
-            
-            for op in fund_ops:
-                if op['operation_type'] in ['SUSCRIPCION', 'COMPRA']:
-                    # Agregar compra al PEPS
-                    peps_calc.add_purchase(op['date'], op['quantity'], op['unit_value'])
-                    fund_analysis['total_purchases'] += op['total_amount']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'COMPRA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount']
-                    })
-                    
-                elif op['operation_type'] in ['RESCATE', 'VENTA']:
-                    # Calcular venta con PEPS
-                    peps_result = peps_calc.calculate_sale(
-                        op['date'], op['quantity'], op['unit_value']
-                    )
-                    
-                    fund_analysis['total_sales'] += op['total_amount']
-                    fund_analysis['total_gain_loss'] += peps_result['gain_loss']
-                    
-                    fund_analysis['operations_detail'].append({
-                        'date': op['date'],
-                        'type': 'VENTA',
-                        'quantity': op['quantity'],
-                        'unit_price': op['unit_value'],
-                        'total': op['total_amount'],
-                        'cost_basis': peps_result['cost_basis'],
-                        'gain_loss': peps_result['gain_loss'],
-                        'used_lots': peps_result.get('used_lots', [])
-                    })
-            
-            # Posición actual
-            fund_analysis['current_position'] = peps_calc.get_current_position()
-            funds_analysis[fund_name] = fund_analysis
-        
-        return funds_analysis
-    
-    def _parse_date(self, date_str: str) -> str:
-        """Convertir fecha a formato ISO"""
-        try:
-            # Intentar formato DD/MM/YYYY
-            if '/' in date_str:
-                parts = date_str.split('/')
-                if len(parts) == 3:
-                    day, month, year = parts
-                    # Validar año
-                    if len(year) == 2:
-                        year = '20' + year if int(year) < 50 else '19' + year
-                    
-                    date_obj = datetime(int(year), int(month), int(day))
-                    return date_obj.strftime('%Y-%m-%d')
-        except (ValueError, IndexError):
-            pass
-        
-        return date_str
-    
-    def process_pdf(self, pdf_path: str) -> Dict:
-        """Procesar PDF completo y retornar operaciones, posiciones y análisis PEPS"""
-        try:
-            text = self.extract_text(pdf_path)
-            if not text.strip():
-                raise Exception("No se pudo extraer texto del PDF")
-            
-            # Parsear con método específico para FIMA
-            parsed_data = self.parse_fima_operations(text, os.path.basename(pdf_path))
-            operations = parsed_data['operations']
-            positions = parsed_data['positions']
-            
-            # Calcular análisis PEPS
-            peps_analysis = self.calculate_peps_analysis(operations)
-            
-            return {
-                'success': True,
-                'operations': operations,
-                'positions': positions,
-                'peps_analysis': peps_analysis,
-                'total_operations': len(operations),
-                'total_positions': len(positions),
-                'pdf_source': os.path.basename(pdf_path)
-            }
-            
-        except Exception as e:
-            logger.error(f"Error procesando PDF {pdf_path}: {e}")
-            return {
-                'success': False,
-                'error': str(e),
-                'operations': [],
-                'positions': [],
-                'peps_analysis': {}
-            }
\ No newline at end of file
+        worker = partial(_process_pdf_worker, preferred_engine=preferred_engine)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            # chunksize=1: los PDFs tienen tamaños muy distintos, repartir de a uno
+            return list(executor.map(worker, pdf_paths, chunksize=1))
+
+def _process_pdf_worker(pdf_path: str, preferred_engine: str = 'pdfplumber') -> Dict:
+    """Punto de entrada de cada proceso: usa su propio PDFProcessor en vez de serializar el del padre"""
+    return PDFProcessor().process_pdf(pdf_path, preferred_engine)